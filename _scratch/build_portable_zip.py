@@ -24,6 +24,7 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import os
 import platform
@@ -32,11 +33,13 @@ import subprocess
 import sys
 import tempfile
 import venv
+import zipfile
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=None)
 def get_project_info():
-    """Get project metadata from pyproject.toml and source code."""
+    """Get project metadata from pyproject.toml and source code (parsed once per run)."""
     project_root = Path(__file__).parent
 
     # Try to get version from the source
@@ -61,18 +64,19 @@ def get_project_info():
     return {"name": app_name, "version": version, "root": project_root}
 
 
+# Normalized architecture names used in distribution file names
+_ARCH_MAP = {"x86_64": "x64", "amd64": "x64", "arm64": "arm64", "aarch64": "arm64"}
+
+
+@functools.lru_cache(maxsize=None)
 def get_platform_info():
-    """Get current platform information for naming."""
+    """Get current platform information for naming (computed once per process)."""
     system = platform.system().lower()
     machine = platform.machine().lower()
 
-    # Normalize architecture names
-    if machine in ("x86_64", "amd64"):
-        arch = "x64"
-    elif machine.startswith("arm") or machine.startswith("aarch"):
-        arch = "arm64"
-    else:
-        arch = machine
+    arch = _ARCH_MAP.get(machine)
+    if arch is None:
+        arch = "arm64" if machine.startswith(("arm", "aarch")) else machine
 
     return f"{system}-{arch}"
 
@@ -84,33 +88,28 @@ def create_python_environment(target_dir: Path, include_azure: bool = False):
     # Create virtual environment
     venv.create(target_dir, with_pip=True, clear=True)
 
-    # Get pip executable path
+    # Get python executable path
     if os.name == "nt":
-        pip_exe = target_dir / "Scripts" / "pip.exe"
         python_exe = target_dir / "Scripts" / "python.exe"
     else:
-        pip_exe = target_dir / "bin" / "pip"
         python_exe = target_dir / "bin" / "python"
 
     print("Installing dependencies...")
 
-    # Upgrade pip first
+    # Upgrade pip first; the pip bundled with older Pythons may not build the project from pyproject.toml
     subprocess.run([str(python_exe), "-m", "pip", "install", "--upgrade", "pip"], check=True)
 
-    # Install core dependencies
-    core_deps = ["click>=8.0.0", "colorama>=0.4.0"]
-    subprocess.run([str(pip_exe), "install"] + core_deps, check=True)
-
-    # Install Azure dependencies if requested
+    # Install dependencies and the CLI app itself in one resolver run
+    packages = ["click>=8.0.0", "colorama>=0.4.0"]
     if include_azure:
-        print("Installing Azure dependencies...")
-        azure_deps = ["azure-identity>=1.12.0", "azure-mgmt-core>=1.3.0", "azure-core>=1.24.0", "msal>=1.20.0"]
-        subprocess.run([str(pip_exe), "install"] + azure_deps, check=True)
+        print("Including Azure dependencies...")
+        packages += ["azure-identity>=1.12.0", "azure-mgmt-core>=1.3.0", "azure-core>=1.24.0", "msal>=1.20.0"]
 
-    # Install the CLI app itself
     project_root = get_project_info()["root"]
     extras = "[azure,broker]" if include_azure else ""
-    subprocess.run([str(pip_exe), "install", "-e", f"{project_root}{extras}"], check=True)
+    # Regular (non-editable) install so the zip is self-contained instead of pointing back at this checkout
+    packages.append(f"{project_root}{extras}")
+    subprocess.run([str(python_exe), "-m", "pip", "install"] + packages, check=True)
 
     return python_exe
 
@@ -206,24 +205,45 @@ Built on: {platform.platform()}
     readme_file.write_text(readme_content, encoding="utf-8")
 
 
+_PRUNE_DIRS = frozenset(("__pycache__", "tests", "test"))
+
+
+def _prune(path):
+    """Recursively remove bytecode caches and test directories below path."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name in _PRUNE_DIRS:
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                _prune(entry.path)
+
+
 def cleanup_environment(env_dir: Path):
     """Remove unnecessary files to reduce distribution size."""
     print("Cleaning up environment...")
 
     # Remove test directories and __pycache__
-    for root, dirs, files in os.walk(env_dir):
-        # Remove __pycache__ directories
-        if "__pycache__" in dirs:
-            pycache_path = Path(root) / "__pycache__"
-            shutil.rmtree(pycache_path, ignore_errors=True)
-            dirs.remove("__pycache__")
+    _prune(env_dir)
+
+
+# Already-compressed or binary payloads gain little from deflate; store them as-is
+_STORED_SUFFIXES = (".whl", ".so", ".pyd", ".dylib", ".dll", ".zip")
+
 
-        # Remove test directories
-        for test_dir in ["tests", "test"]:
-            if test_dir in dirs:
-                test_path = Path(root) / test_dir
-                shutil.rmtree(test_path, ignore_errors=True)
-                dirs.remove(test_dir)
+def write_zip(zip_path: Path, root_dir: Path, base_dir: str):
+    """Zip root_dir/base_dir, storing binaries and using fast deflate for everything else."""
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for root, dirs, files in os.walk(root_dir / base_dir):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                arcname = os.path.relpath(path, root_dir)
+                if name.endswith(_STORED_SUFFIXES):
+                    zf.write(path, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zf.write(path, arcname)
 
 
 def build_zip_distribution(version: str = None, include_azure: bool = False, output_dir: str = None):
@@ -276,7 +296,7 @@ def build_zip_distribution(version: str = None, include_azure: bool = False, out
         zip_path = output_path / f"{dist_name}.zip"
         print(f"Creating ZIP file: {zip_path}")
 
-        shutil.make_archive(str(zip_path.with_suffix("")), "zip", root_dir=str(temp_path), base_dir=dist_name)
+        write_zip(zip_path, temp_path, dist_name)
 
         # Get file size
         zip_size_mb = zip_path.stat().st_size / (1024 * 1024)
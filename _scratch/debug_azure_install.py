@@ -8,29 +8,26 @@ import subprocess
 import sys
 import tempfile
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 def run_command(cmd, check=True):
-    """Run a command and return the result"""
+    """Run a command, streaming its combined output live, and return the result"""
     print(f"🔧 Running: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(cmd, check=check, capture_output=True, text=True)
+    buf = []
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            buf.append(line)
+    result = subprocess.CompletedProcess(cmd, proc.returncode, stdout="".join(buf))
+    if result.returncode == 0:
         print(f"✅ Exit code: {result.returncode}")
-        if result.stdout:
-            print(f"📤 STDOUT:\n{result.stdout}")
-        if result.stderr:
-            print(f"📤 STDERR:\n{result.stderr}")
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Command failed with exit code {e.returncode}")
-        if e.stdout:
-            print(f"📤 STDOUT:\n{e.stdout}")
-        if e.stderr:
-            print(f"📤 STDERR:\n{e.stderr}")
+    else:
+        print(f"❌ Command failed with exit code {result.returncode}")
         if check:
-            raise
-        return e
+            raise subprocess.CalledProcessError(result.returncode, cmd, output=result.stdout)
+    return result
 
 
 def main():
@@ -72,9 +69,27 @@ def main():
             "msal[broker]>=1.20.0,<2",
         ]
 
+        # Fetch all packages concurrently so the network phase overlaps; the installs below
+        # stay sequential because pip serializes writes into the same venv anyway
+        wheel_dir = Path(temp_dir) / "wheels"
+        print(f"\n⬇️  Downloading Azure packages in parallel to: {wheel_dir}")
+
+        def download(package):
+            cmd = pip_cmd + ["download", "--no-cache-dir", "-d", str(wheel_dir), package]
+            return package, subprocess.run(cmd, capture_output=True, text=True)
+
+        with ThreadPoolExecutor(max_workers=len(azure_packages)) as pool:
+            for package, result in pool.map(download, azure_packages):
+                if result.returncode == 0:
+                    print(f"✅ Downloaded {package}")
+                else:
+                    print(f"❌ Download of {package} failed with exit code {result.returncode}")
+                    if result.stderr:
+                        print(f"📤 STDERR:\n{result.stderr}")
+
         for package in azure_packages:
             print(f"\n🧪 Testing installation of: {package}")
-            run_command(pip_cmd + ["install", "--no-cache-dir", "-v", package], check=False)
+            run_command(pip_cmd + ["install", "--no-index", "--find-links", str(wheel_dir), "-v", package], check=False)
 
             # Check if package was installed
             package_name = package.split(">=")[0].split("[")[0]
@@ -40,6 +40,8 @@ hiddenimports = [
     # Core application
     'mycli_app',
     'mycli_app.cli',
+    'mycli_app.config',
+    'mycli_app.resource',
     'mycli_app.__main__',
     
     # CLI framework
@@ -36,7 +36,8 @@ def can_import(module_name):
 # ---------------------------
 # Hidden Imports
 # ---------------------------
-hiddenimports = []
+# Subcommand modules are imported lazily via importlib, which static analysis cannot see
+hiddenimports = ["mycli_app.config", "mycli_app.resource"]
 
 if INCLUDE_AZURE:
     optional_modules = [
@@ -0,0 +1,57 @@
+"""Entry point the mycli bundle launchers run with the bundle's own Python.
+
+create_macos_bundle.py copies this file into the bundle's lib/ directory, so bin/mycli only passes a short
+path to the interpreter instead of the program text.
+"""
+
+import os
+import sys
+
+
+def print_debug_info():
+    """Describe the interpreter, sys.path and Azure imports on stderr, for diagnosing broken bundles."""
+    # Debug: Print Python path information
+    print("Debug: Python executable:", sys.executable, file=sys.stderr)
+    print("Debug: Python path:", sys.path, file=sys.stderr)
+
+    # Debug: Try to find site-packages
+    for path in sys.path:
+        if "site-packages" in path:
+            print(f"Debug: Found site-packages at: {path}", file=sys.stderr)
+            # Check if azure packages exist
+            azure_path = os.path.join(path, "azure")
+            if os.path.exists(azure_path):
+                print(f"Debug: Azure packages found at: {azure_path}", file=sys.stderr)
+            else:
+                print(f"Debug: No azure packages at: {azure_path}", file=sys.stderr)
+
+    # Debug: Test Azure imports before running main
+    try:
+        import azure.identity
+
+        print(f"Debug: azure.identity imported successfully from {azure.identity.__file__}", file=sys.stderr)
+    except ImportError as e:
+        print(f"Debug: azure.identity import failed: {e}", file=sys.stderr)
+
+    try:
+        import azure.core
+
+        print(f"Debug: azure.core imported successfully from {azure.core.__file__}", file=sys.stderr)
+    except ImportError as e:
+        print(f"Debug: azure.core import failed: {e}", file=sys.stderr)
+
+
+# Diagnostics import Azure eagerly, so they only run when asked for
+if os.environ.get("MYCLI_DEBUG"):
+    print_debug_info()
+
+try:
+    from mycli_app.cli import main
+except ImportError as e:
+    print(f"Error: Could not import mycli_app.cli module: {e}", file=sys.stderr)
+    print("Bundle structure may be incomplete", file=sys.stderr)
+    print("Python path:", os.environ.get("PYTHONPATH", ""), file=sys.stderr)
+    print("Site packages:", os.environ.get("MYCLI_SITE_PACKAGES", ""), file=sys.stderr)
+    sys.exit(1)
+
+sys.exit(main())
@@ -0,0 +1,72 @@
+"""Bundle verification probe: Azure packages and the CLI's view of them.
+
+Run by create_macos_bundle.py with the bundle's own interpreter. Both checks share one Python startup
+and one set of Azure imports; each part of the report starts with a "=== SECTION: <name> ===" line.
+"""
+
+import sys
+from importlib import metadata
+
+failed = False
+
+print("=== SECTION: azure_packages ===")
+# Check if specific packages from pyproject.toml are installed
+required_packages = ["azure-identity", "azure-mgmt-core", "azure-core", "msal"]
+
+print("\n=== Checking Required Azure Packages ===")
+missing_packages = []
+
+for package_name in required_packages:
+    try:
+        print(f"✅ {package_name}: {metadata.version(package_name)}")
+    except metadata.PackageNotFoundError:
+        print(f"❌ {package_name}: NOT INSTALLED")
+        missing_packages.append(package_name)
+
+# Test basic imports
+print("\n=== Testing Basic Azure Imports ===")
+for module_name, package_name in (
+    ("azure.identity", "azure-identity"),
+    ("azure.mgmt.core", "azure-mgmt-core"),
+    ("azure.core", "azure-core"),
+    ("msal", "msal"),
+):
+    try:
+        module = __import__(module_name, fromlist=["__version__"])
+        print(f"✅ {module_name} imported - version: {module.__version__}")
+    except ImportError as e:
+        print(f"❌ {module_name} import failed: {e}")
+        missing_packages.append(package_name)
+
+if missing_packages:
+    print(f"\n❌ Missing packages: {', '.join(missing_packages)}")
+    print("AZURE_AVAILABLE=False")
+    failed = True
+else:
+    print("\n✅ All required Azure packages are installed and importable")
+    print("AZURE_AVAILABLE=True")
+
+print("=== SECTION: cli_import ===")
+# Test the same imports that mycli_app.cli would use
+print("\n=== Testing CLI Azure Import Context ===")
+
+import site
+
+print(f"Site packages dirs: {site.getsitepackages()}")
+
+try:
+    # Test the exact imports that mycli_app.cli uses
+    from mycli_app.cli import AZURE_AVAILABLE
+
+    print(f"✅ AZURE_AVAILABLE from CLI: {AZURE_AVAILABLE}")
+
+    if AZURE_AVAILABLE:
+        print("✅ Azure packages detected by CLI module")
+    else:
+        # The package section above already reports which Azure imports fail
+        print("❌ Azure packages NOT detected by CLI module")
+except ImportError as e:
+    print(f"❌ Failed to import from mycli_app.cli: {e}")
+    failed = True
+
+sys.exit(1 if failed else 0)
@@ -0,0 +1,18 @@
+"""Bundle verification probe: run `mycli --version` and `mycli --help` through click.
+
+Run by create_macos_bundle.py with the bundle's own interpreter; prints one JSON object keyed by option.
+The launcher script itself is exercised separately by the status probe.
+"""
+
+import contextlib
+import io
+import json
+from mycli_app.cli import cli
+
+results = {}
+for args in (["--version"], ["--help"]):
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        code = cli.main(args=args, prog_name="mycli", standalone_mode=False)
+    results[args[0]] = {"code": code or 0, "output": buf.getvalue().strip()}
+print(json.dumps(results))
@@ -7,39 +7,90 @@ This script is designed to run in GitHub Actions and create packages suitable fo
 import os
 import sys
 import shutil
+import stat
+import string
 import subprocess
+import gzip
 import tarfile
+import threading
+import hashlib
 import argparse
+import contextlib
+import fcntl
+import functools
 import tempfile
 import json
 import platform
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for --compression zst when the zstd CLI is missing
+    zstandard = None
+
+
+# Set by --quiet: command output is still captured, but only printed for commands that fail
+QUIET = False
+
+# Fixed timestamp for archive members so identical inputs produce an identical SHA256
+SOURCE_DATE_EPOCH = int(os.environ.get("SOURCE_DATE_EPOCH", "1700000000"))
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a command and return the result."""
+
+def run_command(cmd, cwd=None, check=True, env=None):
+    """Run a command, echoing its output line by line while also capturing it for callers that parse it.
+
+    stderr is merged into stdout, so memory use tracks only the captured text and logs appear in real time.
+    """
+    print(f"Running: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
+    sys.stdout.flush()
+    proc = subprocess.Popen(
+        cmd, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+    )
+    lines = []
+    for line in proc.stdout:
+        if not QUIET:
+            sys.stdout.write(line)
+        lines.append(line)
+    returncode = proc.wait()
+    output = "".join(lines)
+    if QUIET and returncode != 0:
+        sys.stdout.write(output)
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, output)
+    return subprocess.CompletedProcess(cmd, returncode, output, "")
+
+
+def run_streaming(cmd, cwd=None, check=True, env=None):
+    """Run a command with its output going straight to the console instead of being buffered.
+
+    Use for long, chatty commands (venv, pip) whose output is only shown, never parsed.
+    """
+    if QUIET:
+        return run_command(cmd, cwd=cwd, check=check, env=env)
     print(f"Running: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
-    result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=check)
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr and result.returncode != 0:
-        print(f"Error: {result.stderr}")
-    return result
+    sys.stdout.flush()
+    return subprocess.run(cmd, cwd=cwd, check=check, env=env)
 
 
-def run_command_with_env(cmd, env_vars, cwd=None, check=True):
-    """Run a command with custom environment variables."""
-    print(f"Running with custom env: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
-    result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=check, env=env_vars)
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr and result.returncode != 0:
-        print(f"Error: {result.stderr}")
-    return result
+@functools.lru_cache(maxsize=None)
+def macos_product_version():
+    """Return the macOS product version reported by sw_vers, or None; the subprocess runs once per build."""
+    try:
+        result = run_command(["sw_vers", "-productVersion"], check=False)
+    except Exception:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
 
 
+@functools.lru_cache(maxsize=None)
 def get_macos_info():
-    """Get macOS system information."""
+    """Get macOS system information.
+
+    Collected once per process; the result is a read-only mapping so callers cannot alter the cached copy.
+    """
     system_info = {
         "platform": platform.system(),
         "machine": platform.machine(),
@@ -48,17 +99,165 @@ def get_macos_info():
     }
 
     # Get macOS version if available
+    macos_version = macos_product_version()
+    if macos_version:
+        system_info["macos_version"] = macos_version
+
+    return MappingProxyType(system_info)
+
+
+# Oldest pip trusted to build the bundle as-is; older venv pips get upgraded first. Before 24.1 pip
+# vendored pyparsing, whose testing.py module cleanup_bundle's test* rule deletes, breaking pip show.
+MIN_PIP_VERSION = (24, 1)
+
+
+def pip_version(pip_cmd, env=None):
+    """Return the (major, minor) version of the pip behind pip_cmd, or (0, 0) if it cannot be determined."""
+    result = run_command(pip_cmd + ["--version"], check=False, env=env)
     try:
-        result = run_command(["sw_vers", "-productVersion"], check=False)
-        if result.returncode == 0:
-            system_info["macos_version"] = result.stdout.strip()
-    except Exception:
-        pass
+        # "pip 24.0 from /path/to/site-packages/pip (python 3.12)"
+        return tuple(int(part) for part in result.stdout.split()[1].split(".")[:2])
+    except (IndexError, ValueError):
+        return (0, 0)
+
+
+def list_installed_packages(pip_cmd, env=None):
+    """Return {normalized name: version} for the environment behind pip_cmd, from one `pip list` run."""
+    result = subprocess.run(pip_cmd + ["list", "--format=json"], capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        print(f"pip list failed: {result.stderr.strip()}")
+        return {}
+    return {pkg["name"].lower().replace("_", "-"): pkg["version"] for pkg in json.loads(result.stdout)}
+
+
+def binary_policy(only_binary=False):
+    """Return the pip option choosing between wheels and sdists for packages that come from an index.
+
+    By default wheels are preferred but an sdist-only dependency can still be built; with only_binary any
+    dependency that has no compatible wheel fails the build instead of silently compiling.
+    """
+    return "--only-binary=:all:" if only_binary else "--prefer-binary"
+
+
+def resolve_pins(pip_cmd, requirements, env_vars, only_binary=False):
+    """Resolve requirements without installing anything and return name==version pins for every index package.
+
+    Uses pip's installation report (pip >= 22.2); local directory requirements are left out of the result.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report_path = Path(temp_dir) / "report.json"
+        resolve_args = ["install", "--dry-run", "--ignore-installed", "--quiet", "--report", str(report_path)]
+        # Pick the newest version that ships a wheel over a newer sdist-only release, which would need compiling
+        resolve_args.append(binary_policy(only_binary))
+        run_streaming(pip_cmd + resolve_args + requirements, env=env_vars)
+        report = json.loads(report_path.read_text())
+    return [
+        f"{item['metadata']['name']}=={item['metadata']['version']}"
+        for item in report["install"]
+        if "dir_info" not in item["download_info"]
+    ]
+
+
+DEFAULT_WHEEL_CACHE = Path.home() / ".cache" / "mycli-bundle" / "wheelhouse"
+
 
-    return system_info
+def build_or_reuse_wheelhouse(pip_cmd, project_root, cache_dir, target_arch, python_tag, env_vars, only_binary=False):
+    """Return a wheelhouse with the project's dependency closure, rebuilding it only when its inputs change.
 
+    The cache key covers pyproject.toml, the target architecture and the Python version, since all
+    three decide which wheels pip resolves. Binary-only wheelhouses are kept apart, so one is never
+    served a wheel that was built from an sdist.
+    """
+    key = hashlib.sha256((project_root / "pyproject.toml").read_bytes())
+    key.update(f"{target_arch}-py{python_tag}".encode())
+    if only_binary:
+        key.update(b"-only-binary")
+    wheelhouse = Path(cache_dir) / key.hexdigest()[:16]
 
-def create_macos_venv_bundle(output_dir, python_version=None, arch=None, version=None):
+    if wheelhouse.is_dir():
+        print(f"Reusing cached wheelhouse: {wheelhouse}")
+    else:
+        print(f"Building wheelhouse: {wheelhouse}")
+        # Build into a scratch directory and rename on success so a failed build is never reused
+        partial = wheelhouse.with_name(wheelhouse.name + ".partial")
+        shutil.rmtree(partial, ignore_errors=True)
+        partial.mkdir(parents=True)
+        wheel_args = pip_cmd + ["wheel", "--no-deps", binary_policy(only_binary), "--wheel-dir", str(partial)]
+        # Resolve once, then fetch every pinned wheel in a single pip process with no further resolution.
+        # Build backend requirements are included so the project itself can still be built with --no-index.
+        pins = resolve_pins(
+            pip_cmd, ["setuptools>=45", "wheel", f"{project_root}[azure,broker]"], env_vars, only_binary
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pins_file = Path(temp_dir) / "pins.txt"
+            pins_file.write_text("\n".join(pins) + "\n")
+            run_streaming(wheel_args + ["-r", str(pins_file)], env=env_vars)
+        partial.rename(wheelhouse)
+
+    return wheelhouse
+
+
+def venv_cache_entry(cache_dir, pyproject_file, target_arch, python_exe, bundle_path, only_binary=False):
+    """Return the cache directory for a bundle venv built from these inputs.
+
+    Keyed like the wheelhouse, plus the resolved base interpreter that the venv's bin/python links to,
+    so a runner image update with a new Python build never reuses a venv pointing at a missing binary.
+    The bundle path is part of the key too: it is baked into pyvenv.cfg and script shebangs.
+    Binary-only venvs are kept apart, so one never inherits a dependency that was built from an sdist.
+    """
+    key = hashlib.sha256(pyproject_file.read_bytes())
+    interpreter = os.path.realpath(shutil.which(python_exe) or python_exe)
+    key.update(f"{target_arch}-{interpreter}-{bundle_path}".encode())
+    if only_binary:
+        key.update(b"-only-binary")
+    return Path(cache_dir) / key.hexdigest()[:16]
+
+
+def store_venv_cache(bundle_path, cached_venv):
+    """Copy a freshly installed bundle venv into the cache, publishing it only once the copy is complete.
+
+    A real copy rather than hardlinks: later build steps rewrite files such as bin/mycli in place.
+    """
+    print(f"Caching venv: {cached_venv}")
+    partial = cached_venv.with_name(cached_venv.name + ".partial")
+    shutil.rmtree(partial, ignore_errors=True)
+    shutil.copytree(bundle_path, partial, symlinks=True)
+    partial.rename(cached_venv)
+
+
+@contextlib.contextmanager
+def locked_build_dir(build_dir):
+    """Yield build_dir emptied and exclusively locked, removing it again on exit.
+
+    Concurrent builds with the same build_dir wait for the lock instead of deleting each other's tree.
+    """
+    build_dir.parent.mkdir(parents=True, exist_ok=True)
+    with open(build_dir.with_name(build_dir.name + ".lock"), "w") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print(f"Waiting for another build using {build_dir}...")
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        shutil.rmtree(build_dir, ignore_errors=True)
+        build_dir.mkdir()
+        try:
+            yield build_dir
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+
+def create_macos_venv_bundle(
+    output_dir,
+    python_version=None,
+    arch=None,
+    version=None,
+    wheel_cache=None,
+    zip_site_packages=False,
+    compression="gz",
+    venv_cache=None,
+    skip_verify=False,
+    only_binary=False,
+):
     """Create a macOS-specific virtual environment bundle."""
 
     # Ensure we're on macOS
@@ -76,28 +275,45 @@ def create_macos_venv_bundle(output_dir, python_version=None, arch=None, version
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Create temporary directory for building
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    # Build at a fixed per-architecture path under the output directory: venv creation bakes the bundle location
+    # into pyvenv.cfg, bin/activate* and script shebangs, so a random temporary directory would change the
+    # tarball's SHA256 on every run
+    target_arch = arch or system_info["machine"]
+    with locked_build_dir(output_path.resolve() / ".build" / target_arch) as temp_path:
         bundle_name = f"mycli-{system_info['machine']}"
         bundle_path = temp_path / bundle_name
 
         print(f"Creating macOS bundle in: {bundle_path}")
 
-        # Step 1: Create virtual environment
+        # Step 1: Create virtual environment, or copy a cached one that already has the dependencies
         python_exe = sys.executable if not python_version else f"python{python_version}"
-        run_command([python_exe, "-m", "venv", str(bundle_path)])
+        project_root = Path(__file__).parent.parent.parent
+        pyproject_file = project_root / "pyproject.toml"
+
+        cached_venv = None
+        if venv_cache and pyproject_file.exists():
+            cached_venv = venv_cache_entry(
+                venv_cache, pyproject_file, target_arch, python_exe, bundle_path, only_binary
+            )
+        venv_reused = cached_venv is not None and cached_venv.is_dir()
+        if venv_reused:
+            print(f"Reusing cached venv: {cached_venv}")
+            shutil.copytree(cached_venv, bundle_path, symlinks=True)
+        else:
+            run_streaming([python_exe, "-m", "venv", str(bundle_path)])
 
         # macOS-specific paths
         venv_python = bundle_path / "bin" / "python"
         bin_dir = bundle_path / "bin"
 
         # Use python -m pip for better reliability (same as successful Windows test)
-        pip_cmd = [str(venv_python), "-m", "pip"]
+        # and skip pip's self-update probe against PyPI on every invocation
+        pip_cmd = [str(venv_python), "-m", "pip", "--disable-pip-version-check"]
 
         # Set environment variables for x86_64 builds to ensure correct architecture
         env_vars = os.environ.copy()
-        target_arch = arch or system_info["machine"]
+        # Keep pip's own imports from writing __pycache__ into the bundle; installs already pass --no-compile
+        env_vars["PYTHONDONTWRITEBYTECODE"] = "1"
         if target_arch == "x86_64":
             print("Setting x86_64-specific environment variables for correct architecture...")
             env_vars.update(
@@ -110,61 +326,57 @@ def create_macos_venv_bundle(output_dir, python_version=None, arch=None, version
             )
             print("Environment variables set for x86_64 compilation")
 
-        # Step 2: Upgrade pip and install wheel
-        run_command_with_env(pip_cmd + ["install", "--upgrade", "pip", "wheel"], env_vars)
+        # Step 2: Upgrade pip and install wheel, only if the venv's bundled pip is too old
+        if pip_version(pip_cmd, env=env_vars) < MIN_PIP_VERSION:
+            run_streaming(pip_cmd + ["install", "--no-compile", "--upgrade", "pip", "wheel"], env=env_vars)
 
         # Step 3: Install dependencies
-        install_args = pip_cmd + ["install", "--no-cache-dir"]
+        # cleanup_bundle strips all bytecode afterwards, so skip compiling it at install time; when resolving
+        # against PyPI, prefer wheels (or, with only_binary, require them) so a new sdist-only release never
+        # triggers a native build
+        install_args = pip_cmd + ["install", "--no-compile", binary_policy(only_binary)]
 
         # Install project dependencies from pyproject.toml
-        project_root = Path(__file__).parent.parent.parent
-        pyproject_file = project_root / "pyproject.toml"
-
         if pyproject_file.exists():
             print("Installing from pyproject.toml...")
-            # First install the Azure dependencies explicitly
-            print("Installing Azure dependencies explicitly...")
-            azure_dependencies = [
-                "azure-identity>=1.12.0",
-                "azure-mgmt-core>=1.3.0",
-                "azure-core>=1.24.0",
-                "msal[broker]>=1.20.0,<2",
-            ]
-            # Use modified run_command that passes environment variables
-            run_command_with_env(install_args + azure_dependencies, env_vars)
-
-            # Force reinstall azure-core to ensure all submodules are present
-            print("Force reinstalling azure-core to ensure completeness...")
-            force_reinstall_args = pip_cmd + ["install", "--force-reinstall", "--no-deps"]
-            run_command_with_env(force_reinstall_args + ["azure-core>=1.24.0"], env_vars)
-
-            # Then reinstall dependencies for azure-core
-            azure_core_args = pip_cmd + ["install"]
-            run_command_with_env(azure_core_args + ["azure-core>=1.24.0"], env_vars)
-
-            # Then install the project with optional dependencies [azure,broker]
-            print("Installing mycli-app package with [azure,broker] extras...")
-            # Use regular install instead of editable for bundling
-            project_install_args = pip_cmd + ["install"]
-            run_command_with_env(project_install_args + [f"{project_root}[azure,broker]"], env_vars)
+            # Resolve everything from a local wheelhouse so unchanged dependencies skip PyPI entirely
+            python_tag = python_version or f"{sys.version_info.major}.{sys.version_info.minor}"
+            wheelhouse = build_or_reuse_wheelhouse(
+                pip_cmd,
+                project_root,
+                wheel_cache or DEFAULT_WHEEL_CACHE,
+                target_arch,
+                python_tag,
+                env_vars,
+                only_binary,
+            )
+            install_args += ["--no-index", "--find-links", str(wheelhouse)]
 
-            # List installed packages for debugging
+            if venv_reused:
+                # pyproject.toml is unchanged since the cached venv was built, so only the project's code can differ
+                print("Reinstalling mycli-app package into the cached venv...")
+                run_streaming(install_args + ["--no-deps", "--force-reinstall", str(project_root)], env=env_vars)
+            else:
+                # The [azure,broker] extras in pyproject.toml declare every Azure dependency, so one resolver
+                # run over the project installs them all
+                print("Installing mycli-app package with [azure,broker] extras...")
+                # Use regular install instead of editable for bundling
+                run_streaming(install_args + [f"{project_root}[azure,broker]"], env=env_vars)
+                if cached_venv is not None:
+                    store_venv_cache(bundle_path, cached_venv)
+
+            # List installed packages for debugging, and check the Azure ones from the same pip run
             print("\nInstalled packages:")
-            run_command(pip_cmd + ["list"], check=False)
+            installed = list_installed_packages(pip_cmd, env_vars)
+            for name, pkg_version in sorted(installed.items()):
+                print(f"  {name} {pkg_version}")
 
-            # Check for Azure packages specifically
             print("\nChecking for Azure packages:")
-            azure_check = run_command(pip_cmd + ["show", "azure-core"], check=False)
-            if azure_check.returncode == 0:
-                print("azure-core is installed")
-            else:
-                print("azure-core is NOT installed")
-
-            azure_identity_check = run_command(pip_cmd + ["show", "azure-identity"], check=False)
-            if azure_identity_check.returncode == 0:
-                print("azure-identity is installed")
-            else:
-                print("azure-identity is NOT installed")
+            for package in ("azure-core", "azure-identity"):
+                if package in installed:
+                    print(f"{package} is installed")
+                else:
+                    print(f"{package} is NOT installed")
         else:
             # Fallback: Install basic dependencies manually
             print("Installing basic dependencies...")
@@ -176,12 +388,9 @@ def create_macos_venv_bundle(output_dir, python_version=None, arch=None, version
                 "azure-core>=1.24.0",
                 "msal[broker]>=1.20.0,<2",
             ]
-            run_command(install_args + dependencies)
-
-            # Install the package itself
-            print("Installing mycli-app package...")
+            # Install them together with the package itself in one resolver run
             # Use regular install instead of editable for bundling
-            run_command_with_env(pip_cmd + ["install", str(project_root)], env_vars)
+            run_streaming(install_args + dependencies + [str(project_root)], env=env_vars)
 
         # Log architecture info (platform-specific wheels are automatically chosen by pip on native systems)
         if arch == "arm64" or (arch is None and system_info["machine"] == "arm64"):
@@ -189,29 +398,50 @@ def create_macos_venv_bundle(output_dir, python_version=None, arch=None, version
         elif arch == "x86_64" or (arch is None and system_info["machine"] == "x86_64"):
             print("Building for Intel (x86_64) - using native wheels")
 
-        # Step 4: Create macOS-specific launcher script
-        create_macos_launcher(bundle_path, bin_dir)
-
-        # Step 5: Create application bundle metadata
-        create_bundle_metadata(bundle_path, system_info, arch)
+        # Steps 4-5: Create the launcher script and bundle metadata. They write disjoint files
+        # (bin/mycli*, bundle_info.json/README.md), so the two run side by side.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            steps = [
+                pool.submit(create_macos_launcher, bundle_path, bin_dir),
+                pool.submit(create_bundle_metadata, bundle_path, system_info, arch),
+            ]
+            for step in steps:
+                step.result()
 
-        # Step 6: Clean up unnecessary files
+        # Step 6: Clean up unnecessary files once nothing else is writing into bin/ and lib/
         cleanup_bundle(bundle_path)
 
-        # Step 6.5: Verify bundle functionality before distribution
-        verify_bundle_functionality(bundle_path)
+        # Step 6.25: Optionally collapse pure-Python packages into a single zip
+        if zip_site_packages:
+            zip_pure_packages(bundle_path)
+
+        # Step 6.4: Replace duplicate files with hardlinks so the tarball stores each payload once
+        hardlink_duplicates(bundle_path)
+
+        # Step 6.5: Verify bundle functionality before distribution (release builds should never skip this)
+        if skip_verify:
+            print("⚠️  Skipping bundle verification (--skip-verify)")
+        else:
+            verify_bundle_functionality(bundle_path)
 
         # Step 7: Create distribution packages
-        create_distribution_packages(bundle_path, output_path, bundle_name, system_info, arch, version)
+        create_distribution_packages(bundle_path, output_path, bundle_name, system_info, arch, version, compression)
 
         print("\n✅ macOS bundle created successfully!")
         return bundle_path
 
 
+# Python entry point shipped in the bundle's lib/ directory and run by bin/mycli
+LAUNCHER_BOOTSTRAP = Path(__file__).resolve().parent / "_mycli_bootstrap.py"
+
+
 def create_macos_launcher(bundle_path, bin_dir):
     """Create macOS-specific launcher script."""
     print("Setting up launcher...")
 
+    # Both launcher variants exec this entry point with the bundle's Python
+    shutil.copy2(LAUNCHER_BOOTSTRAP, bundle_path / "lib" / LAUNCHER_BOOTSTRAP.name)
+
     # Check if pip created a console script during installation
     pip_generated_script = bin_dir / "mycli"
     if pip_generated_script.exists():
@@ -231,7 +461,9 @@ if [ -L "$SCRIPT_PATH" ]; then
     SCRIPT_PATH="$(readlink -f "$SCRIPT_PATH" 2>/dev/null || realpath "$SCRIPT_PATH" 2>/dev/null || readlink "$SCRIPT_PATH")"
 fi
 
-SCRIPT_DIR="$(cd "$(dirname "$SCRIPT_PATH")" && pwd)"
+# Strip the file name with parameter expansion instead of forking dirname/pwd subshells
+case "$SCRIPT_PATH" in */*) SCRIPT_DIR="${SCRIPT_PATH%/*}" ;; *) SCRIPT_DIR="." ;; esac
+case "$SCRIPT_DIR" in /*) ;; .) SCRIPT_DIR="$PWD" ;; *) SCRIPT_DIR="$PWD/$SCRIPT_DIR" ;; esac
 
 # Look for Python interpreter - handle both direct use and Homebrew installation
 BUNDLE_PYTHON=""
@@ -275,43 +507,8 @@ if [ -z "$BUNDLE_PYTHON" ] || [ ! -f "$BUNDLE_PYTHON" ]; then
     exit 1
 fi
 
-# Execute the main CLI function
-exec "$BUNDLE_PYTHON" -c "
-import sys
-import os
-
-# Debug: Print Python path information
-print('Debug: Python executable:', sys.executable, file=sys.stderr)
-print('Debug: Python path:', sys.path, file=sys.stderr)
-
-# Debug: Try to find site-packages
-for path in sys.path:
-    if 'site-packages' in path:
-        print(f'Debug: Found site-packages at: {path}', file=sys.stderr)
-        # Check if azure packages exist
-        azure_path = os.path.join(path, 'azure')
-        if os.path.exists(azure_path):
-            print(f'Debug: Azure packages found at: {azure_path}', file=sys.stderr)
-        else:
-            print(f'Debug: No azure packages at: {azure_path}', file=sys.stderr)
-
-# Debug: Test Azure imports before running main
-try:
-    import azure.identity
-    print(f'Debug: azure.identity imported successfully from {azure.identity.__file__}', file=sys.stderr)
-except ImportError as e:
-    print(f'Debug: azure.identity import failed: {e}', file=sys.stderr)
-
-try:
-    import azure.core
-    print(f'Debug: azure.core imported successfully from {azure.core.__file__}', file=sys.stderr)
-except ImportError as e:
-    print(f'Debug: azure.core import failed: {e}', file=sys.stderr)
-
-from mycli_app.cli import main
-if __name__ == '__main__':
-    sys.exit(main())
-" "$@"
+# Execute the main CLI function through the bootstrap shipped in the bundle's lib/ directory
+exec "$BUNDLE_PYTHON" "${BUNDLE_PYTHON%/*}/../lib/_mycli_bootstrap.py" "$@"
 """
 
         # Write the portable script
@@ -334,14 +531,23 @@ if __name__ == '__main__':
 
     print("No pip-generated console script found, creating custom launcher...")
 
+    # The interpreter version is fixed at build time, so resolve site-packages now rather
+    # than walking lib/ with find on every launch
+    python_lib_dirs = sorted((bundle_path / "lib").glob("python3.*/site-packages"))
+    site_packages_rel = (
+        python_lib_dirs[0].relative_to(bundle_path).as_posix() if python_lib_dirs else "lib/site-packages"
+    )
+
     # Main launcher script (fallback if console scripts don't work)
     launcher_content = """#!/bin/bash
 # MyCLI macOS Launcher
 # This script provides a portable way to run mycli on macOS
 
-# Get the directory containing this script
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-BUNDLE_ROOT="$(dirname "$SCRIPT_DIR")"
+# Get the directory containing this script (parameter expansion only, no subshells)
+SCRIPT_PATH="${BASH_SOURCE[0]}"
+case "$SCRIPT_PATH" in */*) SCRIPT_DIR="${SCRIPT_PATH%/*}" ;; *) SCRIPT_DIR="." ;; esac
+case "$SCRIPT_DIR" in /*) ;; .) SCRIPT_DIR="$PWD" ;; *) SCRIPT_DIR="$PWD/$SCRIPT_DIR" ;; esac
+BUNDLE_ROOT="${SCRIPT_DIR%/*}"
 VENV_PYTHON="$SCRIPT_DIR/python"
 
 # Check if we're in the correct bundle structure
@@ -351,8 +557,11 @@ if [ ! -f "$VENV_PYTHON" ]; then
     exit 1
 fi
 
-# Set up environment - expand the glob pattern correctly
-PYTHON_SITEPKG=$(find "$BUNDLE_ROOT/lib" -name "site-packages" -type d 2>/dev/null | head -1)
+# Set up environment - site-packages location is resolved when the bundle is built
+PYTHON_SITEPKG="$BUNDLE_ROOT/@SITE_PACKAGES_REL@"
+if [ ! -d "$PYTHON_SITEPKG" ]; then
+    PYTHON_SITEPKG=$(find "$BUNDLE_ROOT/lib" -name "site-packages" -type d 2>/dev/null | head -1)
+fi
 if [ -n "$PYTHON_SITEPKG" ]; then
     export PYTHONPATH="$PYTHON_SITEPKG:$PYTHONPATH"
 fi
@@ -363,89 +572,15 @@ if [ -f "$VENV_ACTIVATE" ]; then
     source "$VENV_ACTIVATE"
 fi
 
-# Try to run the application with proper error handling
-if ! "$VENV_PYTHON" -c "import mycli_app.cli" 2>/dev/null; then
-    echo "Error: Could not import mycli_app.cli module" >&2
-    echo "Bundle structure may be incomplete" >&2
-    echo "Python path: $PYTHONPATH" >&2
-    echo "Site packages: $PYTHON_SITEPKG" >&2
-    exit 1
-fi
-
-# For Homebrew compatibility, check if we're being called via symlink
-if [ -L "$0" ]; then
-    # Called via Homebrew symlink, use the bundle's Python with entry point
-    exec "$VENV_PYTHON" -c "
-import sys
-import os
-
-# Debug: Print Python path information  
-print('Debug: Python executable:', sys.executable, file=sys.stderr)
-print('Debug: Python path:', sys.path, file=sys.stderr)
-
-# Debug: Try to find site-packages
-for path in sys.path:
-    if 'site-packages' in path:
-        print(f'Debug: Found site-packages at: {path}', file=sys.stderr)
-        # Check if azure packages exist
-        azure_path = os.path.join(path, 'azure')
-        if os.path.exists(azure_path):
-            print(f'Debug: Azure packages found at: {azure_path}', file=sys.stderr)
-        else:
-            print(f'Debug: No azure packages at: {azure_path}', file=sys.stderr)
-
-# Debug: Test Azure imports before running main
-try:
-    import azure.identity
-    print(f'Debug: azure.identity imported successfully from {azure.identity.__file__}', file=sys.stderr)
-except ImportError as e:
-    print(f'Debug: azure.identity import failed: {e}', file=sys.stderr)
-
-try:
-    import azure.core
-    print(f'Debug: azure.core imported successfully from {azure.core.__file__}', file=sys.stderr)
-except ImportError as e:
-    print(f'Debug: azure.core import failed: {e}', file=sys.stderr)
-
-from mycli_app.cli import main; main()" "$@"
-else
-    # Called directly, use the bundle's Python with entry point
-    exec "$VENV_PYTHON" -c "
-import sys
-import os
-
-# Debug: Print Python path information
-print('Debug: Python executable:', sys.executable, file=sys.stderr)
-print('Debug: Python path:', sys.path, file=sys.stderr)
-
-# Debug: Try to find site-packages
-for path in sys.path:
-    if 'site-packages' in path:
-        print(f'Debug: Found site-packages at: {path}', file=sys.stderr)
-        # Check if azure packages exist
-        azure_path = os.path.join(path, 'azure')
-        if os.path.exists(azure_path):
-            print(f'Debug: Azure packages found at: {azure_path}', file=sys.stderr)
-        else:
-            print(f'Debug: No azure packages at: {azure_path}', file=sys.stderr)
-
-# Debug: Test Azure imports before running main
-try:
-    import azure.identity
-    print(f'Debug: azure.identity imported successfully from {azure.identity.__file__}', file=sys.stderr)
-except ImportError as e:
-    print(f'Debug: azure.identity import failed: {e}', file=sys.stderr)
-
-try:
-    import azure.core
-    print(f'Debug: azure.core imported successfully from {azure.core.__file__}', file=sys.stderr)
-except ImportError as e:
-    print(f'Debug: azure.core import failed: {e}', file=sys.stderr)
+# The import check runs inside the bootstrap below rather than in a separate Python process
+export MYCLI_SITE_PACKAGES="$PYTHON_SITEPKG"
 
-from mycli_app.cli import main; main()" "$@"
-fi
+# Called directly or via a Homebrew symlink, run the entry point with the bundle's Python
+exec "$VENV_PYTHON" "$BUNDLE_ROOT/lib/_mycli_bootstrap.py" "$@"
 """
 
+    launcher_content = launcher_content.replace("@SITE_PACKAGES_REL@", site_packages_rel)
+
     launcher_path = bin_dir / "mycli"
     with open(launcher_path, "w") as f:
         f.write(launcher_content)
@@ -468,6 +603,12 @@ def create_bundle_metadata(bundle_path, system_info, arch):
     # Determine architecture
     target_arch = arch or system_info["machine"]
 
+    # Only a reproducible build (SOURCE_DATE_EPOCH set) pins the date; otherwise record when it was actually built
+    if "SOURCE_DATE_EPOCH" in os.environ:
+        build_time = datetime.fromtimestamp(SOURCE_DATE_EPOCH, timezone.utc)
+    else:
+        build_time = datetime.now(timezone.utc)
+
     metadata = {
         "name": "mycli-macos-bundle",
         "version": "1.0.0",  # This should be dynamic based on your app version
@@ -476,9 +617,7 @@ def create_bundle_metadata(bundle_path, system_info, arch):
         "target_architecture": target_arch,
         "macos_version": system_info.get("macos_version"),
         "python_version": system_info["python_version"],
-        "build_date": subprocess.run(
-            ["date", "-u", "+%Y-%m-%dT%H:%M:%SZ"], capture_output=True, text=True
-        ).stdout.strip(),
+        "build_date": build_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
         "homebrew_compatible": True,
         "bundle_structure": {
             "bin/": "Executables and launcher scripts",
@@ -498,8 +637,8 @@ def create_bundle_metadata(bundle_path, system_info, arch):
         },
     }
 
-    with open(bundle_path / "bundle_info.json", "w") as f:
-        json.dump(metadata, f, indent=2)
+    # Serialize up front and write the bytes in one call rather than streaming small chunks through text IO
+    (bundle_path / "bundle_info.json").write_bytes(json.dumps(metadata, indent=2).encode("utf-8"))
 
     # Create a Homebrew-style info file
     homebrew_info = f"""# MyCLI - macOS Bundle
@@ -535,8 +674,21 @@ If using the bundle directly:
 - `bundle_info.json`: Bundle metadata
 """
 
-    with open(bundle_path / "README.md", "w") as f:
-        f.write(homebrew_info)
+    (bundle_path / "README.md").write_bytes(homebrew_info.encode("utf-8"))
+
+
+def fast_rmtree(paths, batch_size=500):
+    """Delete directory trees in bulk with rm -rf, which clears large trees faster than shutil.rmtree.
+
+    Paths are passed in batches so one rm process removes many trees while staying well under ARG_MAX.
+    """
+    paths = [str(path) for path in paths]
+    if not os.path.exists("/bin/rm"):
+        for path in paths:
+            shutil.rmtree(path)
+        return
+    for start in range(0, len(paths), batch_size):
+        subprocess.run(["/bin/rm", "-rf", "--"] + paths[start : start + batch_size], check=True)
 
 
 def cleanup_bundle(bundle_path):
@@ -544,31 +696,218 @@ def cleanup_bundle(bundle_path):
 
     print("Cleaning up bundle...")
 
-    # Remove common unnecessary files
-    cleanup_patterns = [
-        "**/__pycache__",
-        "**/*.pyc",
-        "**/*.pyo",
-        "**/test*",
-        "**/tests*",
-        "**/.git*",
-        "**/.*",
-        "**/bin/pip",  # Only remove pip executable, not files containing "pip"
-        "**/bin/pip[0-9]*",
-        "**/bin/easy_install*",
-    ]
+    # Remove common unnecessary files in a single walk. Matching directories are pruned
+    # before descending, so their contents are never visited.
+    drop_prefixes = ("test", ".")  # test*, tests*, .git* and other dotfiles
+    drop_suffixes = (".pyc", ".pyo")
+
+    def should_remove(parent, name, is_dir):
+        if name.startswith(drop_prefixes):
+            return True
+        if is_dir:
+            return name == "__pycache__"
+        if name.endswith(drop_suffixes):
+            return True
+        # Only remove pip executables, not files containing "pip"
+        if os.path.basename(parent) == "bin":
+            return name == "pip" or (name.startswith("pip") and name[3:4].isdigit()) or name.startswith("easy_install")
+        return False
+
+    # Matching directory trees are collected during the walk and deleted together afterwards
+    dirs_to_remove = []
+    for root, dirs, files in os.walk(bundle_path):
+        # Extra safety: don't remove anything in azure packages
+        if "azure" in root:
+            dirs.clear()
+            continue
+
+        for name in [d for d in dirs if should_remove(root, d, True) and "azure" not in d]:
+            dirs.remove(name)
+            path = os.path.join(root, name)
+            if os.path.islink(path):
+                os.unlink(path)
+            else:
+                dirs_to_remove.append(path)
+            print(f"Removed directory: {os.path.relpath(path, bundle_path)}")
+
+        for name in files:
+            if should_remove(root, name, False) and "azure" not in name:
+                path = os.path.join(root, name)
+                os.unlink(path)
+                print(f"Removed file: {os.path.relpath(path, bundle_path)}")
+
+    fast_rmtree(dirs_to_remove)
 
-    for pattern in cleanup_patterns:
-        for path in bundle_path.glob(pattern):
-            # Extra safety: don't remove anything in azure packages
-            if "azure" in str(path):
+
+# Packaging tooling stays unzipped so pip keeps working inside the bundle
+ZIP_SKIP_PACKAGES = {"pip", "setuptools", "pkg_resources", "_distutils_hack", "wheel", "__pycache__"}
+NATIVE_SUFFIXES = (".so", ".dylib")
+SITE_PACKAGES_ZIP = "_mycli_site_packages.zip"
+
+ZIP_SITE_PACKAGES_SCRIPT = """
+import os
+import py_compile
+import sys
+import tempfile
+import zipfile
+
+site_packages, zip_name, epoch, names = sys.argv[1], sys.argv[2], int(sys.argv[3]), sys.argv[4:]
+zip_path = os.path.join(site_packages, zip_name)
+with tempfile.TemporaryDirectory() as tmp, zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    pyc = os.path.join(tmp, "module.pyc")
+    for name in names:
+        top = os.path.join(site_packages, name)
+        paths = [top]
+        if os.path.isdir(top):
+            # Directory entries are needed for zipimport to find namespace packages such as azure
+            for root, dirs, files in os.walk(top):
+                dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+                paths += [os.path.join(root, d) for d in dirs] + [os.path.join(root, f) for f in sorted(files)]
+        for path in paths:
+            arcname = os.path.relpath(path, site_packages).replace(os.sep, "/")
+            # Zip entries carry the file mtime, so pin it for a reproducible archive
+            os.utime(path, (epoch, epoch))
+            zf.write(path, arcname)
+            if os.path.isdir(path) or not arcname.endswith(".py"):
+                continue
+            # zipimport cannot write bytecode caches, so store an unchecked-hash .pyc beside each source
+            try:
+                py_compile.compile(
+                    path,
+                    cfile=pyc,
+                    dfile=os.path.join(zip_path, arcname),
+                    doraise=True,
+                    invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+                )
+            except py_compile.PyCompileError:
                 continue
-            if path.is_file():
-                path.unlink()
-                print(f"Removed file: {path.relative_to(bundle_path)}")
-            elif path.is_dir():
-                shutil.rmtree(path)
-                print(f"Removed directory: {path.relative_to(bundle_path)}")
+            os.utime(pyc, (epoch, epoch))
+            zf.write(pyc, arcname[:-3] + ".pyc")
+"""
+
+
+def zip_pure_packages(bundle_path):
+    """Move pure-Python packages from site-packages into a single zip imported via a .pth file."""
+
+    print("Zipping pure-Python packages...")
+
+    site_dirs = sorted((bundle_path / "lib").glob("python3.*/site-packages"))
+    if not site_dirs:
+        print("  No site-packages directory found, skipping")
+        return
+    site_packages = site_dirs[0]
+
+    def is_pure(path):
+        for _root, _dirs, files in os.walk(path):
+            if any(name.endswith(NATIVE_SUFFIXES) for name in files):
+                return False
+        return True
+
+    names = []
+    for entry in sorted(os.scandir(site_packages), key=lambda e: e.name):
+        if entry.name in ZIP_SKIP_PACKAGES or entry.name.endswith((".dist-info", ".egg-info")):
+            continue
+        if entry.is_file(follow_symlinks=False) and entry.name.endswith(".py"):
+            names.append(entry.name)
+        elif entry.is_dir(follow_symlinks=False) and is_pure(entry.path):
+            names.append(entry.name)
+
+    if not names:
+        print("  No pure-Python packages to zip")
+        return
+
+    # Compile with the bundle's own interpreter so the stored bytecode matches its version
+    python_path = bundle_path / "bin" / "python"
+    subprocess.run(
+        [
+            str(python_path),
+            "-c",
+            ZIP_SITE_PACKAGES_SCRIPT,
+            str(site_packages),
+            SITE_PACKAGES_ZIP,
+            str(SOURCE_DATE_EPOCH),
+        ]
+        + names,
+        check=True,
+    )
+
+    for name in names:
+        path = site_packages / name
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+    (site_packages / "_mycli_site_packages.pth").write_text(SITE_PACKAGES_ZIP + "\n")
+
+    zip_size_mb = (site_packages / SITE_PACKAGES_ZIP).stat().st_size / (1024 * 1024)
+    print(f"  Zipped {len(names)} top-level packages/modules into {SITE_PACKAGES_ZIP} ({zip_size_mb:.1f} MB)")
+
+
+def hardlink_duplicates(bundle_path, min_size=1024):
+    """Replace byte-identical regular files in the bundle with hardlinks to a single copy.
+
+    tarfile stores later links to an already-archived inode as zero-length link members, so duplicated
+    license, metadata and vendored files are compressed only once. Files are grouped by size first and
+    hashed only when sizes collide; walk order is sorted so the canonical copy is deterministic. Files the
+    tarball leaves out are never linked: tarfile would otherwise write a kept copy as a link to a missing member.
+    """
+
+    print("Hardlinking duplicate files...")
+
+    by_size = {}
+    for root, dirs, files in os.walk(bundle_path):
+        dirs[:] = sorted(d for d in dirs if not is_generated_file(d))
+        for name in sorted(files):
+            if is_generated_file(name):
+                continue
+            path = os.path.join(root, name)
+            st = os.lstat(path)
+            if stat.S_ISREG(st.st_mode) and st.st_size >= min_size:
+                by_size.setdefault(st.st_size, []).append(path)
+
+    def sha256_of(path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.digest()
+
+    linked = saved = 0
+    for size, paths in by_size.items():
+        if len(paths) < 2:
+            continue
+        canonical = {}
+        for path in paths:
+            original = canonical.setdefault(sha256_of(path), path)
+            if original == path or os.path.samefile(original, path):
+                continue
+            # Link under a temporary name first so the file is never missing if linking fails
+            temp_link = f"{path}.mycli-link"
+            os.link(original, temp_link)
+            os.replace(temp_link, path)
+            linked += 1
+            saved += size
+
+    print(f"  Hardlinked {linked} duplicate files ({saved / (1024 * 1024):.1f} MB)")
+
+
+# Verification probe scripts, run with the bundle's own interpreter by verify_bundle_functionality
+VERIFY_SCRIPTS_DIR = Path(__file__).resolve().parent
+# Marks the start of each part of the _verify_azure.py report
+SECTION_MARKER = "=== SECTION: "
+
+
+def split_probe_sections(output):
+    """Split _verify_azure.py output into {section name: stripped section text}."""
+    sections = {}
+    name = None
+    for line in output.splitlines():
+        if line.startswith(SECTION_MARKER) and line.endswith(" ==="):
+            name = line[len(SECTION_MARKER) : -len(" ===")]
+            sections[name] = []
+        elif name is not None:
+            sections[name].append(line)
+    return {name: "\n".join(lines).strip() for name, lines in sections.items()}
 
 
 def verify_bundle_functionality(bundle_path):
@@ -592,87 +931,31 @@ def verify_bundle_functionality(bundle_path):
     current_mode = mycli_path.stat().st_mode
     mycli_path.chmod(current_mode | stat.S_IEXEC)
 
-    # Test Azure dependencies are available
-    print("  Testing Azure dependencies...")
-    try:
-        # Simple verification of pyproject.toml azure/broker packages
-        azure_check_script = """
-import sys
-import subprocess
+    # The probes are independent, read-only subprocesses: start them together so their interpreter startups
+    # and Azure imports overlap, then check the results one at a time in a fixed order below
+    probe_commands = {
+        "azure": ([str(python_path), str(VERIFY_SCRIPTS_DIR / "_verify_azure.py")], 30),
+        "cli": ([str(python_path), str(VERIFY_SCRIPTS_DIR / "_verify_cli.py")], 60),
+        "status": ([str(mycli_path), "status"], 30),
+    }
+    with ThreadPoolExecutor(max_workers=len(probe_commands)) as pool:
+        probes = {
+            name: pool.submit(subprocess.run, cmd, capture_output=True, text=True, timeout=timeout, check=True)
+            for name, (cmd, timeout) in probe_commands.items()
+        }
+        check_probe_results(probes)
 
-# Check if specific packages from pyproject.toml are installed
-required_packages = [
-    "azure-identity>=1.12.0",
-    "azure-mgmt-core>=1.3.0", 
-    "azure-core>=1.24.0",
-    "msal>=1.20.0"
-]
 
-print("\\n=== Checking Required Azure Packages ===")
-missing_packages = []
+def check_probe_results(probes):
+    """Report the verification probe results started by verify_bundle_functionality, raising on failure."""
 
-for package_spec in required_packages:
-    package_name = package_spec.split(">=")[0].split("[")[0]
+    # Test Azure dependencies are available
+    print("  Testing Azure dependencies...")
     try:
-        result = subprocess.run([sys.executable, "-m", "pip", "show", package_name], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            # Extract version from pip show output
-            for line in result.stdout.split("\\n"):
-                if line.startswith("Version:"):
-                    version = line.split(":")[1].strip()
-                    print(f"✅ {package_name}: {version}")
-                    break
-        else:
-            print(f"❌ {package_name}: NOT INSTALLED")
-            missing_packages.append(package_name)
-    except Exception as e:
-        print(f"❌ {package_name}: Error checking - {e}")
-        missing_packages.append(package_name)
-
-# Test basic imports
-print("\\n=== Testing Basic Azure Imports ===")
-try:
-    import azure.identity
-    print(f"✅ azure.identity imported - version: {azure.identity.__version__}")
-except ImportError as e:
-    print(f"❌ azure.identity import failed: {e}")
-    missing_packages.append("azure-identity")
-
-try:
-    import azure.mgmt.core
-    print(f"✅ azure.mgmt.core imported - version: {azure.mgmt.core.__version__}")
-except ImportError as e:
-    print(f"❌ azure.mgmt.core import failed: {e}")
-    missing_packages.append("azure-mgmt-core")
-
-try:
-    import azure.core
-    print(f"✅ azure.core imported - version: {azure.core.__version__}")
-except ImportError as e:
-    print(f"❌ azure.core import failed: {e}")
-    missing_packages.append("azure-core")
-
-try:
-    import msal
-    print(f"✅ msal imported - version: {msal.__version__}")
-except ImportError as e:
-    print(f"❌ msal import failed: {e}")
-    missing_packages.append("msal")
-
-if missing_packages:
-    print(f"\\n❌ Missing packages: {', '.join(missing_packages)}")
-    print("AZURE_AVAILABLE=False")
-    sys.exit(1)
-else:
-    print("\\n✅ All required Azure packages are installed and importable")
-    print("AZURE_AVAILABLE=True")
-"""
-        result = subprocess.run(
-            [str(python_path), "-c", azure_check_script], capture_output=True, text=True, timeout=30, check=True
-        )
+        result = probes["azure"].result()
+        azure_sections = split_probe_sections(result.stdout)
 
-        azure_output = result.stdout.strip()
+        azure_output = azure_sections.get("azure_packages", "")
         print("  ✅ Azure dependencies check:")
         for line in azure_output.split("\n"):
             print(f"    {line}")
@@ -689,50 +972,44 @@ else:
         print("  ❌ Azure dependencies check timed out")
         raise Exception("Azure dependencies check timed out")
 
-    # Test version command
-    print("  Testing version command...")
+    # Test version and help commands in one interpreter so the CLI import cost is paid once;
+    # the launcher script itself is still exercised by the status check below
+    print("  Testing version and help commands...")
     try:
-        result = subprocess.run([str(mycli_path), "--version"], capture_output=True, text=True, timeout=30, check=True)
-
-        version_output = result.stdout.strip()
-        print(f"  ✅ Version output: {version_output}")
-
-        # Verify the output contains expected content
-        if "MyCliApp version" not in version_output:
-            print("  ⚠️  Warning: Version output doesn't contain 'MyCliApp version'")
-            print(f"  ⚠️  Actual output: '{version_output}'")
-            # Don't fail here, just warn
-
+        result = probes["cli"].result()
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
     except subprocess.CalledProcessError as e:
-        print(f"  ❌ Version command failed with exit code {e.returncode}")
+        print(f"  ❌ Version/help check failed with exit code {e.returncode}")
         print(f"  ❌ stdout: {e.stdout}")
         print(f"  ❌ stderr: {e.stderr}")
-        raise Exception(f"Version command failed: {e}")
+        raise Exception(f"Version/help check failed: {e}")
     except subprocess.TimeoutExpired:
-        print("  ❌ Version command timed out")
-        raise Exception("Version command timed out")
-
-    # Test help command
-    print("  Testing help command...")
-    try:
-        result = subprocess.run([str(mycli_path), "--help"], capture_output=True, text=True, timeout=30, check=True)
-
-        help_output = result.stdout.strip()
-        print(f"  ✅ Help command succeeded (output length: {len(help_output)} chars)")
-
-    except subprocess.CalledProcessError as e:
-        print(f"  ❌ Help command failed with exit code {e.returncode}")
-        print(f"  ❌ stdout: {e.stdout}")
-        print(f"  ❌ stderr: {e.stderr}")
-        raise Exception(f"Help command failed: {e}")
-    except subprocess.TimeoutExpired:
-        print("  ❌ Help command timed out")
-        raise Exception("Help command timed out")
+        print("  ❌ Version/help check timed out")
+        raise Exception("Version/help check timed out")
+    except (IndexError, ValueError):
+        print(f"  ❌ Could not parse version/help check output: {result.stdout}")
+        raise Exception("Version/help check produced no result")
+
+    version_result, help_result = probe["--version"], probe["--help"]
+    if version_result["code"] != 0:
+        raise Exception(f"Version command failed with exit code {version_result['code']}")
+    version_output = version_result["output"]
+    print(f"  ✅ Version output: {version_output}")
+
+    # Verify the output contains expected content
+    if "MyCliApp version" not in version_output:
+        print("  ⚠️  Warning: Version output doesn't contain 'MyCliApp version'")
+        print(f"  ⚠️  Actual output: '{version_output}'")
+        # Don't fail here, just warn
+
+    if help_result["code"] != 0:
+        raise Exception(f"Help command failed with exit code {help_result['code']}")
+    print(f"  ✅ Help command succeeded (output length: {len(help_result['output'])} chars)")
 
     # Test Azure authentication availability check
     print("  Testing Azure authentication availability...")
     try:
-        result = subprocess.run([str(mycli_path), "status"], capture_output=True, text=True, timeout=30, check=True)
+        result = probes["status"].result()
 
         status_output = result.stdout.strip()
         print("  ✅ Status command succeeded")
@@ -757,138 +1034,184 @@ else:
         print("  ❌ Status command timed out")
         raise Exception("Status command timed out")
 
-    # Test the actual Azure import issue that's causing the CLI to fail
+    # Test the actual Azure import issue that's causing the CLI to fail (reported by the Azure probe above)
     print("  Testing Azure imports in CLI context...")
-    try:
-        azure_cli_test_script = """
-import sys
-import os
+    cli_test_output = azure_sections.get("cli_import", "")
+    print("  ✅ CLI Azure context test:")
+    for line in cli_test_output.split("\n"):
+        print(f"    {line}")
 
-# Test the same imports that mycli_app.cli would use
-print("\\n=== Testing CLI Azure Import Context ===")
+    if "AZURE_AVAILABLE from CLI: False" in cli_test_output:
+        print("  ❌ CLI module reports Azure as NOT available")
+        raise Exception("CLI module cannot detect Azure packages even though they're installed")
+    elif "AZURE_AVAILABLE from CLI: True" in cli_test_output:
+        print("  ✅ CLI module reports Azure as available")
 
-# Add the bundle's site-packages to sys.path if needed
-import site
-print(f"Site packages dirs: {site.getsitepackages()}")
+    print("  ✅ Bundle verification completed successfully!")
 
-try:
-    # Test the exact imports that mycli_app.cli uses
-    from mycli_app.cli import AZURE_AVAILABLE
-    print(f"✅ AZURE_AVAILABLE from CLI: {AZURE_AVAILABLE}")
-    
-    if AZURE_AVAILABLE:
-        print("✅ Azure packages detected by CLI module")
-    else:
-        print("❌ Azure packages NOT detected by CLI module")
-        # Try to understand why
-        try:
-            import azure.identity
-            print("  - azure.identity is importable directly")
-        except ImportError as e:
-            print(f"  - azure.identity import fails: {e}")
-        
-        try:
-            import azure.core  
-            print("  - azure.core is importable directly")
-        except ImportError as e:
-            print(f"  - azure.core import fails: {e}")
-        
-        try:
-            import azure.mgmt.core
-            print("  - azure.mgmt.core is importable directly") 
-        except ImportError as e:
-            print(f"  - azure.mgmt.core import fails: {e}")
-            
-        try:
-            import msal
-            print("  - msal is importable directly")
-        except ImportError as e:
-            print(f"  - msal import fails: {e}")
-        
-except ImportError as e:
-    print(f"❌ Failed to import from mycli_app.cli: {e}")
-    sys.exit(1)
-"""
 
-        result = subprocess.run(
-            [str(python_path), "-c", azure_cli_test_script], capture_output=True, text=True, timeout=30, check=True
-        )
+class HashingWriter:
+    """Write-through file wrapper that feeds every chunk into a SHA256 digest and counts the bytes written."""
 
-        cli_test_output = result.stdout.strip()
-        print("  ✅ CLI Azure context test:")
-        for line in cli_test_output.split("\n"):
-            print(f"    {line}")
+    def __init__(self, f):
+        self.f = f
+        self.sha256 = hashlib.sha256()
+        self.nbytes = 0
 
-        if "AZURE_AVAILABLE from CLI: False" in cli_test_output:
-            print("  ❌ CLI module reports Azure as NOT available")
-            raise Exception("CLI module cannot detect Azure packages even though they're installed")
-        elif "AZURE_AVAILABLE from CLI: True" in cli_test_output:
-            print("  ✅ CLI module reports Azure as available")
+    def write(self, data):
+        self.sha256.update(data)
+        self.nbytes += len(data)
+        return self.f.write(data)
 
-    except subprocess.CalledProcessError as e:
-        print(f"  ❌ CLI Azure context test failed with exit code {e.returncode}")
-        print(f"  ❌ stdout: {e.stdout}")
-        print(f"  ❌ stderr: {e.stderr}")
-        raise Exception(f"CLI Azure context test failed: {e}")
-    except subprocess.TimeoutExpired:
-        print("  ❌ CLI Azure context test timed out")
-        raise Exception("CLI Azure context test timed out")
+    def flush(self):
+        self.f.flush()
 
-    print("  ✅ Bundle verification completed successfully!")
+    def hexdigest(self):
+        return self.sha256.hexdigest()
+
+
+def is_generated_file(name):
+    """Return True for the file and directory names exclude_generated_files keeps out of the tarball."""
+    return name in ("__pycache__", ".DS_Store") or name.endswith((".pyc", ".pyo"))
+
+
+def exclude_generated_files(tarinfo):
+    """tarfile filter dropping files that reappear after cleanup_bundle ran.
+
+    Covers bytecode caches regenerated while verifying the bundle and Finder's .DS_Store files.
+    """
+    if is_generated_file(tarinfo.name.rsplit("/", 1)[-1]):
+        return None
+    return tarinfo
 
 
-def create_distribution_packages(bundle_path, output_path, bundle_name, system_info, arch, version=None):
+def normalize_tarinfo(tarinfo):
+    """tarfile filter that drops generated files and pins mtime/ownership for reproducible archives."""
+    tarinfo = exclude_generated_files(tarinfo)
+    if tarinfo is not None:
+        tarinfo.mtime = SOURCE_DATE_EPOCH
+        tarinfo.uid = tarinfo.gid = 0
+        tarinfo.uname = tarinfo.gname = "root"
+    return tarinfo
+
+
+TARBALL_SUFFIXES = {"gz": ".tar.gz", "zst": ".tar.zst"}
+ZSTD_LEVEL = 10
+# gzip's default level, as pigz uses; Python's GzipFile would otherwise default to the much slower 9
+GZIP_LEVEL = 6
+# tarfile writes in 10 KiB records and copies file data in 16 KiB chunks by default; larger buffers mean far
+# fewer write calls into the compressor for a venv full of multi-megabyte files
+TAR_BUFSIZE = 2 * 1024 * 1024
+# Plain GNU headers: normalized members never need PAX records, and both GNU tar and bsdtar read GNU long names
+TAR_OPTIONS = {"format": tarfile.GNU_FORMAT, "bufsize": TAR_BUFSIZE, "copybufsize": TAR_BUFSIZE}
+
+
+def open_fallback_compressor(out, compression):
+    """Return an in-process compressing stream over out, for when no compressor CLI is installed."""
+    if compression == "gz":
+        return gzip.GzipFile(filename="", mode="wb", fileobj=out, compresslevel=GZIP_LEVEL, mtime=0)
+    if zstandard is None:
+        raise Exception("zst compression needs the zstd command line tool or the zstandard package")
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1).stream_writer(out, closefd=False)
+
+
+def write_tarball(bundle_path, tar_path, arcname, compression="gz", members=None):
+    """Write bundle_path to a compressed tarball and return (SHA256, size in bytes), both taken from the write.
+
+    If members is a list, the TarInfo of every archived entry is appended to it in archive order, so
+    callers can describe the contents without walking the tree again.
+
+    gz compresses on all cores with pigz when available, falling back to Python's gzip; zst uses the
+    multi-threaded zstd CLI, falling back to the optional zstandard package. Members are added in sorted
+    order with normalized metadata and the gzip header carries no name or timestamp, so rebuilding
+    unchanged contents with the same compressor yields the same checksum.
+    """
+    if compression == "zst":
+        zstd = shutil.which("zstd")
+        compressor = [zstd, "-q", f"-{ZSTD_LEVEL}", "-T0", "-c"] if zstd else None
+    else:
+        pigz = shutil.which("pigz")
+        compressor = [pigz, "-n", f"-{GZIP_LEVEL}", "-p", str(os.cpu_count() or 1), "-c"] if pigz else None
+
+    def add_filter(tarinfo):
+        tarinfo = normalize_tarinfo(tarinfo)
+        if tarinfo is not None and members is not None:
+            members.append(tarinfo)
+        return tarinfo
+
+    with open(tar_path, "wb") as raw:
+        out = HashingWriter(raw)
+        if not compressor:
+            with open_fallback_compressor(out, compression) as stream:
+                with tarfile.open(fileobj=stream, mode="w|", **TAR_OPTIONS) as tar:
+                    tar.add(bundle_path, arcname=arcname, filter=add_filter)
+            return out.hexdigest(), out.nbytes
+
+        proc = subprocess.Popen(compressor, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        # Drain the compressor on a separate thread so neither pipe can fill up and stall the other side
+        pump = threading.Thread(target=shutil.copyfileobj, args=(proc.stdout, out, 1 << 20))
+        pump.start()
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|", **TAR_OPTIONS) as tar:
+                tar.add(bundle_path, arcname=arcname, filter=add_filter)
+        finally:
+            proc.stdin.close()
+            pump.join()
+            returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, compressor)
+    return out.hexdigest(), out.nbytes
+
+
+def create_distribution_packages(
+    bundle_path, output_path, bundle_name, system_info, arch, version=None, compression="gz"
+):
     """Create various distribution packages for macOS."""
 
     target_arch = arch or system_info["machine"]
     # Use provided version or fall back to macOS version
     package_version = version or system_info.get("macos_version", "unknown")
 
-    # Create tar.gz archive (most common for Homebrew)
-    print("Creating tar.gz archive...")
-    tar_name = f"{bundle_name}-{package_version}-{target_arch}.tar.gz"
+    # Create the tarball (tar.gz by default, the most common format for Homebrew)
+    suffix = TARBALL_SUFFIXES[compression]
+    print(f"Creating {suffix[1:]} archive...")
+    tar_name = f"{bundle_name}-{package_version}-{target_arch}{suffix}"
     tar_path = output_path / tar_name
 
-    with tarfile.open(tar_path, "w:gz") as tar:
-        tar.add(bundle_path, arcname=bundle_name)
+    members = []
+    checksum, tar_size = write_tarball(bundle_path, tar_path, bundle_name, compression, members=members)
 
-    # Get file size
-    tar_size = tar_path.stat().st_size
+    # File size is the byte count seen while writing, so no stat() is needed
     tar_size_mb = tar_size / (1024 * 1024)
-    print(f"Created tar.gz: {tar_name} ({tar_size_mb:.1f} MB)")
+    print(f"Created {suffix[1:]}: {tar_name} ({tar_size_mb:.1f} MB)")
 
-    # Create SHA256 checksum for Homebrew
-    print("Creating SHA256 checksum...")
-    result = run_command(["shasum", "-a", "256", str(tar_path)])
-    if result.returncode == 0:
-        checksum = result.stdout.split()[0]
-        checksum_file = output_path / f"{tar_name}.sha256"
-        with open(checksum_file, "w") as f:
-            f.write(f"{checksum}  {tar_name}\n")
-        print(f"SHA256: {checksum}")
+    # Write SHA256 checksum for Homebrew (computed while the archive was written)
+    checksum_file = output_path / f"{tar_name}.sha256"
+    with open(checksum_file, "w") as f:
+        f.write(f"{checksum}  {tar_name}\n")
+    print(f"SHA256: {checksum}")
 
-        # Create Homebrew formula template
-        create_homebrew_formula_template(output_path, bundle_name, tar_name, checksum, system_info)
+    # Create Homebrew formula template
+    create_homebrew_formula_template(output_path, bundle_name, tar_name, checksum, system_info)
 
-    # Create directory structure info
-    create_structure_info(bundle_path, output_path, bundle_name)
+    # Create directory structure info from the entries just archived
+    create_structure_info(members, output_path, bundle_name)
 
 
-def create_homebrew_formula_template(output_path, bundle_name, tar_name, sha256, system_info):
-    """Create a Homebrew formula template."""
-
-    formula_content = f"""# Homebrew Formula Template for MyCLI
+# Ruby's #{...} interpolation passes through string.Template untouched; only $names are substituted
+# and $$ stands for a literal $
+FORMULA_TEMPLATE = string.Template("""# Homebrew Formula Template for MyCLI
 # Save this as mycli.rb in your Homebrew tap
 
 class Mycli < Formula
   desc "Command-line interface for Azure authentication and resource management"
   homepage "https://github.com/naga-nandyala/mycli-app"
-  url "https://github.com/naga-nandyala/mycli-app/releases/download/v1.0.0/{tar_name}"
-  sha256 "{sha256}"
+  url "https://github.com/naga-nandyala/mycli-app/releases/download/v1.0.0/$tar_name"
+  sha256 "$sha256"
   license "MIT"
 
   depends_on "python@3.12"
-  depends_on arch: :{system_info['machine']}
+  depends_on arch: :$machine
 
   def install
     # Install the bundle
@@ -897,7 +1220,7 @@ class Mycli < Formula
     # Create wrapper script
     (bin/"mycli").write <<~EOS
       #!/bin/bash
-      exec "#{"{"}libexec{"}"}/bin/mycli" "$@"
+      exec "#{libexec}/bin/mycli" "$$@"
     EOS
     
     chmod 0755, bin/"mycli"
@@ -907,7 +1230,13 @@ class Mycli < Formula
     assert_match "MyCliApp version", shell_output("#{bin}/mycli --version")
   end
 end
-"""
+""")
+
+
+def create_homebrew_formula_template(output_path, bundle_name, tar_name, sha256, system_info):
+    """Create a Homebrew formula template."""
+
+    formula_content = FORMULA_TEMPLATE.substitute(tar_name=tar_name, sha256=sha256, machine=system_info["machine"])
 
     formula_path = output_path / "mycli.rb"
     with open(formula_path, "w") as f:
@@ -916,29 +1245,34 @@ end
     print("Created Homebrew formula template: mycli.rb")
 
 
-def create_structure_info(bundle_path, output_path, bundle_name):
-    """Create bundle structure information."""
+def create_structure_info(members, output_path, bundle_name):
+    """Create bundle structure information from the TarInfo entries recorded by write_tarball."""
 
+    max_entries = 100  # Limit output
     structure_info = []
-
-    def collect_structure(path, prefix=""):
-        for item in sorted(path.iterdir()):
-            if item.is_dir():
-                structure_info.append(f"{prefix}{item.name}/")
-                if len(structure_info) < 100:  # Limit output
-                    collect_structure(item, prefix + "  ")
-            else:
-                size = item.stat().st_size
-                structure_info.append(f"{prefix}{item.name} ({size} bytes)")
-
-    collect_structure(bundle_path)
+    # tarfile adds directory contents in sorted, depth-first order, so indenting by depth reproduces the tree
+    for member in members:
+        rel_path = member.name.partition("/")[2]
+        if not rel_path:
+            continue  # the bundle root itself
+        if len(structure_info) >= max_entries:
+            structure_info.append(f"... (truncated after {max_entries} entries)")
+            break
+        prefix = "  " * rel_path.count("/")
+        base = rel_path.rsplit("/", 1)[-1]
+        if member.isdir():
+            structure_info.append(f"{prefix}{base}/")
+        elif member.islnk():
+            # Duplicates stored as hardlinks carry no data of their own; show which file they share
+            structure_info.append(f"{prefix}{base} (hardlink to {member.linkname.partition('/')[2]})")
+        elif member.issym():
+            structure_info.append(f"{prefix}{base} -> {member.linkname}")
+        else:
+            structure_info.append(f"{prefix}{base} ({member.size} bytes)")
 
     structure_file = output_path / f"{bundle_name}-structure.txt"
-    with open(structure_file, "w") as f:
-        f.write("Bundle Structure:\n")
-        f.write("=" * 50 + "\n")
-        for line in structure_info:
-            f.write(line + "\n")
+    lines = ["Bundle Structure:", "=" * 50] + structure_info
+    structure_file.write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
 
     print(f"Created structure info: {bundle_name}-structure.txt")
 
@@ -952,18 +1286,82 @@ def main():
         "--arch", choices=["x86_64", "arm64"], help="Target architecture (default: current system architecture)"
     )
     parser.add_argument("--version", help="Package version for naming (e.g., 1.0.0)")
+    parser.add_argument(
+        "--wheel-cache",
+        default=str(DEFAULT_WHEEL_CACHE),
+        help=f"Directory for cached dependency wheelhouses (default: {DEFAULT_WHEEL_CACHE})",
+    )
+
+    parser.add_argument(
+        "--zip-site-packages",
+        action="store_true",
+        help="Collapse pure-Python packages into a single zip on sys.path (fewer files to extract and stat)",
+    )
+
+    parser.add_argument(
+        "--compression",
+        choices=sorted(TARBALL_SUFFIXES),
+        default="gz",
+        help="Tarball compression: gz (default, .tar.gz) or zst (.tar.zst, faster to build and extract)",
+    )
+
+    parser.add_argument(
+        "--venv-cache",
+        help="Directory for cached bundle venvs; reused while pyproject.toml, architecture and Python are unchanged "
+        "(default: disabled)",
+    )
+
+    parser.add_argument(
+        "--only-binary",
+        action="store_true",
+        help="Fail instead of building any dependency from an sdist (pip --only-binary=:all:)",
+    )
+
+    parser.add_argument(
+        "--skip-verify",
+        action="store_true",
+        help="Skip running the bundle's verification probes (for quick local builds, not releases)",
+    )
+
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Hide the output of venv/pip commands unless they fail",
+    )
 
     args = parser.parse_args()
 
+    global QUIET
+    QUIET = args.quiet
+
     print("🍎 Creating macOS bundle for MyCLI...")
     print(f"Output directory: {args.output}")
     print(f"Python version: {args.python_version or 'current'}")
     print(f"Architecture: {args.arch or 'current system'}")
     print(f"Package version: {args.version or 'auto-detect'}")
+    print(f"Wheel cache: {args.wheel_cache}")
+    print(f"Compression: {args.compression}")
+    print(f"Venv cache: {args.venv_cache or 'disabled'}")
+    if args.only_binary:
+        print("Dependencies: wheels only")
+    if args.skip_verify:
+        print("Verification: skipped")
     print("-" * 50)
 
     try:
-        bundle_path = create_macos_venv_bundle(args.output, args.python_version, args.arch, args.version)
+        bundle_path = create_macos_venv_bundle(
+            args.output,
+            args.python_version,
+            args.arch,
+            args.version,
+            args.wheel_cache,
+            args.zip_site_packages,
+            args.compression,
+            args.venv_cache,
+            args.skip_verify,
+            args.only_binary,
+        )
 
         print("\n" + "=" * 50)
         print("🎉 SUCCESS! macOS bundle created.")
@@ -975,7 +1373,7 @@ def main():
                 print(f"   {file.name} ({size:.1f} MB)")
 
         print("\n📋 Next steps for Homebrew:")
-        print("1. Upload the .tar.gz file to GitHub releases")
+        print(f"1. Upload the {TARBALL_SUFFIXES[args.compression]} file to GitHub releases")
         print("2. Update the Homebrew formula with the correct URL and SHA256")
         print("3. Submit to homebrew-core or create a custom tap")
 
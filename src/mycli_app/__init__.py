@@ -4,6 +4,15 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .cli import cli
-
 __all__ = ["cli"]
+
+
+def __getattr__(name):
+    """Import the CLI group on first access, so `python -m mycli_app.cli` does not load the module twice."""
+    if name == "cli":
+        from .cli import cli
+
+        # The submodule import bound the package attribute to the module; rebind it to the click group
+        globals()["cli"] = cli
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,15 @@
+"""
+Output helpers shared by the top-level CLI and its lazily loaded command groups.
+"""
+
+import click
+
+# Pre-rendered status glyphs shared by the dummy resource/config commands
+_OK = click.style("✓", fg="green")
+_LIST = click.style("📋", fg="yellow")
+_TRASH = click.style("🗑️", fg="red")
+
+
+def _emit(lines):
+    """Write buffered output lines with a single call."""
+    click.echo("\n".join(lines))
@@ -8,34 +8,76 @@ import sys
 import os
 import json
 import base64
+import copy
+import functools
+import importlib
 import platform
 from pathlib import Path
-from colorama import init, Fore, Style
+from colorama import init
+
+from mycli_app._output import _emit
 
 # Initialize colorama for Windows terminal color support
 init()
 
-# Azure authentication imports
+# Azure authentication imports are deferred until first needed: the SDK is by far the slowest
+# import here, and --version, --help and the resource/config commands never touch it.
+_azure_available = None
+
+
+def azure_available():
+    """Import the Azure SDK on first call and report whether it is installed."""
+    global _azure_available, InteractiveBrowserCredential, AzureCliCredential, DefaultAzureCredential
+    global SharedTokenCacheCredential, DeviceCodeCredential, ClientAuthenticationError, msal
+    if _azure_available is None:
+        try:
+            from azure.identity import (
+                InteractiveBrowserCredential,
+                AzureCliCredential,
+                DefaultAzureCredential,
+                SharedTokenCacheCredential,
+                DeviceCodeCredential,
+            )
+            from azure.core.exceptions import ClientAuthenticationError
+            import msal
+
+            _azure_available = True
+        except ImportError:
+            _azure_available = False
+    return _azure_available
+
+
+def __getattr__(name):
+    """Resolve AZURE_AVAILABLE lazily so `from mycli_app.cli import AZURE_AVAILABLE` keeps working."""
+    if name == "AZURE_AVAILABLE":
+        return azure_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Optional faster JSON backend for the config file; falls back to the stdlib encoder
 try:
-    from azure.identity import (
-        InteractiveBrowserCredential,
-        AzureCliCredential,
-        DefaultAzureCredential,
-        SharedTokenCacheCredential,
-        DeviceCodeCredential,
-    )
-    from azure.core.exceptions import ClientAuthenticationError
-    import msal
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 
-    AZURE_AVAILABLE = True
 except ImportError:
-    AZURE_AVAILABLE = False
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 __version__ = "1.0.0"
 
 # Configuration file path
 CONFIG_DIR = Path.home() / ".mycli"
 CONFIG_FILE = CONFIG_DIR / "config.json"
+# String forms for the per-command hot path, avoiding Path allocations on every stat/open
+_CONFIG_DIR_PATH = str(CONFIG_DIR)
+_CONFIG_PATH = str(CONFIG_FILE)
 
 # Authentication state
 _auth_state = {
@@ -48,30 +90,50 @@ _auth_state = {
 }
 
 
+_config_dir_ready = False
+
+
 def ensure_config_dir():
-    """Ensure the config directory exists."""
-    CONFIG_DIR.mkdir(exist_ok=True)
+    """Ensure the config directory exists (checked at most once per process)."""
+    global _config_dir_ready
+    if not _config_dir_ready:
+        CONFIG_DIR.mkdir(exist_ok=True)
+        _config_dir_ready = True
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(path_str, mtime_ns):
+    """Parse the config file; cached per (path, mtime) so unchanged files are read once."""
+    with open(path_str, "rb") as f:
+        return _json_loads(f.read())
+
+
+def read_config_file():
+    """Return a deep copy of the parsed config file, or an empty dict if it does not exist.
+
+    Deep, so callers can edit nested sections without changing the cached parse for later reads.
+    """
+    try:
+        mtime_ns = os.stat(_CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return {}
+    return copy.deepcopy(_load_config_cached(_CONFIG_PATH, mtime_ns))
 
 
 def load_auth_state():
     """Load authentication state from config file."""
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                data = json.load(f)
-                _auth_state.update(data.get("auth", {}))
-        except (json.JSONDecodeError, IOError):
-            pass
+    try:
+        data = read_config_file()
+        _auth_state.update(data.get("auth", {}))
+    except (json.JSONDecodeError, IOError):
+        pass
 
 
 def save_auth_state():
     """Save authentication state to config file."""
     ensure_config_dir()
     try:
-        config_data = {}
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, "r") as f:
-                config_data = json.load(f)
+        config_data = read_config_file()
 
         # Only save serializable data
         config_data["auth"] = {
@@ -82,8 +144,8 @@ def save_auth_state():
             "broker_info": _auth_state.get("broker_info"),
         }
 
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config_data, f, indent=2)
+        with open(_CONFIG_PATH, "wb") as f:
+            f.write(_json_dumps(config_data))
     except IOError:
         pass
 
@@ -91,6 +153,8 @@ def save_auth_state():
 def clear_broker_cache():
     """Clear broker-specific cache."""
     try:
+        if not azure_available():
+            raise ImportError("msal is not installed")
         # Create app instance to access broker cache based on platform
         if os.name == "nt":  # Windows
             app = msal.PublicClientApplication(
@@ -147,17 +211,15 @@ def get_native_broker_credential(tenant_id=None):
         accounts = app.get_accounts()
 
         if accounts:
-            click.echo(
-                f"{Fore.YELLOW}⚠️  Found {len(accounts)} cached account(s) - this might skip the popup{Style.RESET_ALL}"
-            )
+            click.secho(f"⚠️  Found {len(accounts)} cached account(s) - this might skip the popup", fg="yellow")
             # Try silent authentication first
             result = app.acquire_token_silent(scopes=["https://management.azure.com/.default"], account=accounts[0])
             if result and "access_token" in result:
-                click.echo(f"{Fore.YELLOW}✓ Used cached broker credentials - no popup needed{Style.RESET_ALL}")
+                click.secho("✓ Used cached broker credentials - no popup needed", fg="yellow")
                 return result, "broker_cached"
 
         # Try interactive broker authentication
-        click.echo(f"{Fore.BLUE}🚨 Starting INTERACTIVE broker authentication - popup should appear{Style.RESET_ALL}")
+        click.secho("🚨 Starting INTERACTIVE broker authentication - popup should appear", fg="blue")
         result = app.acquire_token_interactive(
             scopes=["https://management.azure.com/.default"],
             parent_window_handle=app.CONSOLE_WINDOW_HANDLE,  # Use console window handle for CLI apps
@@ -167,21 +229,19 @@ def get_native_broker_credential(tenant_id=None):
         )
 
         if result and "access_token" in result:
-            click.echo(f"{Fore.GREEN}✓ Interactive broker authentication completed{Style.RESET_ALL}")
+            click.secho("✓ Interactive broker authentication completed", fg="green")
             return result, "broker_interactive"
         else:
             error = result.get("error_description", "Unknown error")
-            click.echo(f"{Fore.RED}Broker authentication failed: {error}{Style.RESET_ALL}")
+            click.secho(f"Broker authentication failed: {error}", fg="red")
             return None, None
 
     except Exception as e:
         error_msg = str(e)
         if "msal[broker]" in error_msg:
-            click.echo(
-                f'{Fore.YELLOW}💡 For native broker support, install: pip install "msal[broker]>=1.20,<2"{Style.RESET_ALL}'
-            )
+            click.secho('💡 For native broker support, install: pip install "msal[broker]>=1.20,<2"', fg="yellow")
         else:
-            click.echo(f"{Fore.RED}Native broker authentication error: {error_msg}{Style.RESET_ALL}")
+            click.secho(f"Native broker authentication error: {error_msg}", fg="red")
         return None, None
 
 
@@ -205,18 +265,16 @@ def get_macos_broker_credential(tenant_id=None):
         accounts = app.get_accounts()
 
         if accounts:
-            click.echo(
-                f"{Fore.YELLOW}⚠️  Found {len(accounts)} cached account(s) - this might skip the popup{Style.RESET_ALL}"
-            )
+            click.secho(f"⚠️  Found {len(accounts)} cached account(s) - this might skip the popup", fg="yellow")
             # Try silent authentication first
             result = app.acquire_token_silent(scopes=["https://management.azure.com/.default"], account=accounts[0])
             if result and "access_token" in result:
-                click.echo(f"{Fore.YELLOW}✓ Used cached broker credentials - no popup needed{Style.RESET_ALL}")
+                click.secho("✓ Used cached broker credentials - no popup needed", fg="yellow")
                 return result, "broker_cached"
 
         # Try interactive broker authentication for macOS
-        click.echo(f"{Fore.BLUE}🚨 Starting INTERACTIVE broker authentication - popup should appear{Style.RESET_ALL}")
-        click.echo(f"{Fore.BLUE}💡 Look for authentication prompt in macOS or Authenticator app{Style.RESET_ALL}")
+        click.secho("🚨 Starting INTERACTIVE broker authentication - popup should appear", fg="blue")
+        click.secho("💡 Look for authentication prompt in macOS or Authenticator app", fg="blue")
 
         # Try different approaches for macOS broker authentication
         try:
@@ -230,9 +288,7 @@ def get_macos_broker_credential(tenant_id=None):
             )
         except Exception as console_error:
             # If console window handle fails, try without it
-            click.echo(
-                f"{Fore.YELLOW}⚠️  Console window handle not supported, trying alternative method...{Style.RESET_ALL}"
-            )
+            click.secho("⚠️  Console window handle not supported, trying alternative method...", fg="yellow")
             try:
                 result = app.acquire_token_interactive(
                     scopes=["https://management.azure.com/.default"],
@@ -242,9 +298,7 @@ def get_macos_broker_credential(tenant_id=None):
                 )
             except Exception as broker_error:
                 # If broker fails, try without broker for this specific case
-                click.echo(
-                    f"{Fore.YELLOW}⚠️  Native broker failed, trying interactive without broker...{Style.RESET_ALL}"
-                )
+                click.secho("⚠️  Native broker failed, trying interactive without broker...", fg="yellow")
                 result = app.acquire_token_interactive(
                     scopes=["https://management.azure.com/.default"],
                     prompt="select_account",  # Force account selection
@@ -252,49 +306,41 @@ def get_macos_broker_credential(tenant_id=None):
                 )
                 # If this works, update the auth method to indicate it's not true broker
                 if result and "access_token" in result:
-                    click.echo(
-                        f"{Fore.YELLOW}✓ Interactive authentication completed (browser fallback){Style.RESET_ALL}"
-                    )
+                    click.secho("✓ Interactive authentication completed (browser fallback)", fg="yellow")
                     return result, "browser_interactive"
 
         if result and "access_token" in result:
-            click.echo(f"{Fore.GREEN}✓ Interactive broker authentication completed{Style.RESET_ALL}")
+            click.secho("✓ Interactive broker authentication completed", fg="green")
             return result, "broker_interactive"
         else:
             error = result.get("error_description", "Unknown error")
-            click.echo(f"{Fore.RED}Broker authentication failed: {error}{Style.RESET_ALL}")
+            click.secho(f"Broker authentication failed: {error}", fg="red")
             return None, None
 
     except Exception as e:
         error_msg = str(e)
         if "msal[broker]" in error_msg:
-            click.echo(
-                f'{Fore.YELLOW}💡 For native broker support on macOS, install: pip install "msal[broker]>=1.20,<2"{Style.RESET_ALL}'
+            click.secho(
+                '💡 For native broker support on macOS, install: pip install "msal[broker]>=1.20,<2"', fg="yellow"
             )
         elif "Company Portal" in error_msg:
-            click.echo(
-                f"{Fore.YELLOW}💡 For full broker features, install Microsoft Company Portal from the App Store{Style.RESET_ALL}"
-            )
+            click.secho("💡 For full broker features, install Microsoft Company Portal from the App Store", fg="yellow")
         elif "parent_window_handle is required" in error_msg:
-            click.echo(f"{Fore.RED}Console window handle error: {error_msg}{Style.RESET_ALL}")
-            click.echo(
-                f"{Fore.YELLOW}💡 This is a known issue with MSAL broker on some macOS versions{Style.RESET_ALL}"
-            )
-            click.echo(f"{Fore.YELLOW}💡 Try using: mycli login --use-device-code{Style.RESET_ALL}")
+            click.secho(f"Console window handle error: {error_msg}", fg="red")
+            click.secho("💡 This is a known issue with MSAL broker on some macOS versions", fg="yellow")
+            click.secho("💡 Try using: mycli login --use-device-code", fg="yellow")
         elif "broker" in error_msg.lower():
-            click.echo(f"{Fore.RED}Broker authentication error: {error_msg}{Style.RESET_ALL}")
-            click.echo(
-                f"{Fore.YELLOW}💡 Ensure Microsoft Company Portal is installed from the App Store{Style.RESET_ALL}"
-            )
-            click.echo(f"{Fore.YELLOW}💡 Ensure Touch ID is enabled in System Preferences{Style.RESET_ALL}")
+            click.secho(f"Broker authentication error: {error_msg}", fg="red")
+            click.secho("💡 Ensure Microsoft Company Portal is installed from the App Store", fg="yellow")
+            click.secho("💡 Ensure Touch ID is enabled in System Preferences", fg="yellow")
         else:
-            click.echo(f"{Fore.RED}Native broker authentication error: {error_msg}{Style.RESET_ALL}")
+            click.secho(f"Native broker authentication error: {error_msg}", fg="red")
         return None, None
 
 
 def get_azure_credential(tenant_id=None, use_broker=False, use_device_code=False):
     """Get Azure credential for authentication."""
-    if not AZURE_AVAILABLE:
+    if not azure_available():
         return None, None
 
     auth_method = "unknown"
@@ -318,11 +364,11 @@ def get_azure_credential(tenant_id=None, use_broker=False, use_device_code=False
                     class MSALBrokerCredential:
                         def __init__(self, msal_result):
                             self.msal_result = msal_result
+                            # Fix the expiry epoch once when the token is issued
+                            self.expires_on = int(time.time()) + msal_result.get("expires_in", 3600)
 
                         def get_token(self, *scopes, **kwargs):
-                            expires_on = self.msal_result.get("expires_in", 3600)
-                            expires_on = int(time.time()) + expires_on
-                            return AccessToken(self.msal_result["access_token"], expires_on)
+                            return AccessToken(self.msal_result["access_token"], self.expires_on)
 
                     return MSALBrokerCredential(broker_result), broker_method
 
@@ -337,11 +383,11 @@ def get_azure_credential(tenant_id=None, use_broker=False, use_device_code=False
                     class MSALBrokerCredential:
                         def __init__(self, msal_result):
                             self.msal_result = msal_result
+                            # Fix the expiry epoch once when the token is issued
+                            self.expires_on = int(time.time()) + msal_result.get("expires_in", 3600)
 
                         def get_token(self, *scopes, **kwargs):
-                            expires_on = self.msal_result.get("expires_in", 3600)
-                            expires_on = int(time.time()) + expires_on
-                            return AccessToken(self.msal_result["access_token"], expires_on)
+                            return AccessToken(self.msal_result["access_token"], self.expires_on)
 
                     return MSALBrokerCredential(broker_result), broker_method
 
@@ -416,10 +462,10 @@ def get_broker_info():
 
 def authenticate_user_with_broker(tenant_id=None, use_device_code=False, force_broker=False):
     """Authenticate user using broker-based authentication."""
-    if not AZURE_AVAILABLE:
-        click.echo(f"{Fore.RED}Azure SDK not available. Install required packages:{Style.RESET_ALL}")
+    if not azure_available():
+        click.secho("Azure SDK not available. Install required packages:", fg="red")
         click.echo("pip install azure-identity azure-mgmt-core azure-core msal")
-        click.echo(f"{Fore.RED}❌ Authentication failed{Style.RESET_ALL}")
+        click.secho("❌ Authentication failed", fg="red")
         return False
 
     try:
@@ -428,68 +474,60 @@ def authenticate_user_with_broker(tenant_id=None, use_device_code=False, force_b
 
         if not broker_info["platform_support"] and not use_device_code:
             if force_broker:
-                click.echo(
-                    f"{Fore.RED}❌ Force broker specified but platform doesn't support native broker authentication{Style.RESET_ALL}"
+                click.secho(
+                    "❌ Force broker specified but platform doesn't support native broker authentication", fg="red"
                 )
                 return False
-            click.echo(f"{Fore.YELLOW}Broker authentication is primarily supported on Windows.{Style.RESET_ALL}")
-            click.echo(f"{Fore.YELLOW}Consider using device code flow with --use-device-code flag.{Style.RESET_ALL}")
+            click.secho("Broker authentication is primarily supported on Windows.", fg="yellow")
+            click.secho("Consider using device code flow with --use-device-code flag.", fg="yellow")
             return False
 
         credential, auth_method = get_azure_credential(tenant_id, use_broker=True, use_device_code=use_device_code)
         if not credential:
-            click.echo(f"{Fore.RED}Failed to create Azure credential{Style.RESET_ALL}")
+            click.secho("Failed to create Azure credential", fg="red")
             return False
 
         # Check if we got a fallback method when force_broker is specified
         if force_broker and auth_method in ["browser_with_broker", "browser", "browser_interactive"]:
-            click.echo(
-                f"{Fore.RED}❌ Force broker specified but only browser authentication is available{Style.RESET_ALL}"
-            )
+            click.secho("❌ Force broker specified but only browser authentication is available", fg="red")
             if platform.system() == "Darwin":  # macOS
-                click.echo(
-                    f"{Fore.YELLOW}💡 Try setting up Touch ID/Face ID or Microsoft Authenticator{Style.RESET_ALL}"
-                )
-                click.echo(f"{Fore.YELLOW}💡 Install Microsoft Company Portal from the App Store{Style.RESET_ALL}")
+                click.secho("💡 Try setting up Touch ID/Face ID or Microsoft Authenticator", fg="yellow")
+                click.secho("💡 Install Microsoft Company Portal from the App Store", fg="yellow")
             else:
-                click.echo(f"{Fore.YELLOW}💡 Try setting up Windows Hello or Microsoft Authenticator{Style.RESET_ALL}")
+                click.secho("💡 Try setting up Windows Hello or Microsoft Authenticator", fg="yellow")
             return False
 
         # Display authentication method info
         if auth_method in ["broker_cached", "broker_interactive"]:
-            click.echo(f"{Fore.BLUE}🔐 Authenticating with Azure using native broker...{Style.RESET_ALL}")
+            click.secho("🔐 Authenticating with Azure using native broker...", fg="blue")
             if broker_info["windows_hello_available"]:
-                click.echo(f"{Fore.GREEN}✓ Windows Hello available{Style.RESET_ALL}")
+                click.secho("✓ Windows Hello available", fg="green")
             if broker_info["keychain_available"]:
-                click.echo(f"{Fore.GREEN}✓ macOS Keychain available{Style.RESET_ALL}")
+                click.secho("✓ macOS Keychain available", fg="green")
             if broker_info["touch_id_available"]:
-                click.echo(f"{Fore.GREEN}✓ Touch ID/Face ID available{Style.RESET_ALL}")
+                click.secho("✓ Touch ID/Face ID available", fg="green")
             if broker_info["authenticator_app_available"]:
-                click.echo(f"{Fore.GREEN}✓ Microsoft Authenticator support available{Style.RESET_ALL}")
+                click.secho("✓ Microsoft Authenticator support available", fg="green")
             if auth_method == "broker_cached":
-                click.echo(f"{Fore.GREEN}✓ Using cached broker credentials{Style.RESET_ALL}")
+                click.secho("✓ Using cached broker credentials", fg="green")
             else:
                 if platform.system() == "Darwin":
-                    click.echo(
-                        f"{Fore.BLUE}💡 Look for authentication prompt in macOS or Authenticator app{Style.RESET_ALL}"
-                    )
+                    click.secho("💡 Look for authentication prompt in macOS or Authenticator app", fg="blue")
                 else:
-                    click.echo(f"{Fore.BLUE}💡 Look for authentication prompt in Windows Security{Style.RESET_ALL}")
+                    click.secho("💡 Look for authentication prompt in Windows Security", fg="blue")
         elif auth_method == "broker_cache":
-            click.echo(f"{Fore.BLUE}🔐 Authenticating with Azure using cached broker tokens...{Style.RESET_ALL}")
+            click.secho("🔐 Authenticating with Azure using cached broker tokens...", fg="blue")
         elif auth_method == "browser_with_broker":
-            click.echo(f"{Fore.BLUE}🔐 Authenticating with Azure using browser (broker fallback)...{Style.RESET_ALL}")
-            click.echo(
-                f"{Fore.YELLOW}💡 Native broker authentication not available, using browser fallback{Style.RESET_ALL}"
-            )
+            click.secho("🔐 Authenticating with Azure using browser (broker fallback)...", fg="blue")
+            click.secho("💡 Native broker authentication not available, using browser fallback", fg="yellow")
         elif auth_method == "device_code":
-            click.echo(f"{Fore.BLUE}🔐 Authenticating with Azure using device code...{Style.RESET_ALL}")
+            click.secho("🔐 Authenticating with Azure using device code...", fg="blue")
         else:
-            click.echo(f"{Fore.BLUE}🔐 Authenticating with Azure using {auth_method}...{Style.RESET_ALL}")
+            click.secho(f"🔐 Authenticating with Azure using {auth_method}...", fg="blue")
 
         # Perform authentication
         if hasattr(credential, "__class__"):
-            click.echo(f"{Fore.BLUE}Credential Type: {credential.__class__.__name__}{Style.RESET_ALL}")
+            click.secho(f"Credential Type: {credential.__class__.__name__}", fg="blue")
 
         token = credential.get_token("https://management.azure.com/.default")
 
@@ -518,13 +556,11 @@ def authenticate_user_with_broker(tenant_id=None, use_device_code=False, force_b
             return True
 
     except ClientAuthenticationError as e:
-        click.echo(f"{Fore.RED}Authentication failed: {str(e)}{Style.RESET_ALL}")
+        click.secho(f"Authentication failed: {str(e)}", fg="red")
         if "broker" in str(e).lower():
-            click.echo(
-                f"{Fore.YELLOW}💡 Tip: Ensure Windows Hello or Microsoft Authenticator is set up{Style.RESET_ALL}"
-            )
+            click.secho("💡 Tip: Ensure Windows Hello or Microsoft Authenticator is set up", fg="yellow")
     except Exception as e:
-        click.echo(f"{Fore.RED}Unexpected error during authentication: {str(e)}{Style.RESET_ALL}")
+        click.secho(f"Unexpected error during authentication: {str(e)}", fg="red")
 
     return False
 
@@ -534,26 +570,26 @@ def authenticate_user(tenant_id=None, use_broker=False, use_device_code=False, f
     if use_broker or force_broker or use_device_code:
         return authenticate_user_with_broker(tenant_id, use_device_code, force_broker)
 
-    if not AZURE_AVAILABLE:
-        click.echo(f"{Fore.RED}Azure SDK not available. Install required packages:{Style.RESET_ALL}")
+    if not azure_available():
+        click.secho("Azure SDK not available. Install required packages:", fg="red")
         click.echo("pip install azure-identity azure-mgmt-core azure-core msal")
-        click.echo(f"{Fore.RED}❌ Authentication failed{Style.RESET_ALL}")
+        click.secho("❌ Authentication failed", fg="red")
         return False
 
     try:
         credential, auth_method = get_azure_credential(tenant_id)
         if not credential:
-            click.echo(f"{Fore.RED}Failed to create Azure credential{Style.RESET_ALL}")
+            click.secho("Failed to create Azure credential", fg="red")
             return False
 
         # Test authentication by getting a token
-        click.echo(f"{Fore.BLUE}🔐 Authenticating with Azure...{Style.RESET_ALL}")
+        click.secho("🔐 Authenticating with Azure...", fg="blue")
 
         # This will trigger browser authentication if needed
         if isinstance(credential, InteractiveBrowserCredential):
-            click.echo(f"{Fore.YELLOW}Opening browser for authentication...{Style.RESET_ALL}")
+            click.secho("Opening browser for authentication...", fg="yellow")
         elif hasattr(credential, "__class__"):
-            click.echo(f"{Fore.BLUE}Using {credential.__class__.__name__}...{Style.RESET_ALL}")
+            click.secho(f"Using {credential.__class__.__name__}...", fg="blue")
 
         token = credential.get_token("https://management.azure.com/.default")
 
@@ -581,9 +617,9 @@ def authenticate_user(tenant_id=None, use_broker=False, use_device_code=False, f
             return True
 
     except ClientAuthenticationError as e:
-        click.echo(f"{Fore.RED}Authentication failed: {str(e)}{Style.RESET_ALL}")
+        click.secho(f"Authentication failed: {str(e)}", fg="red")
     except Exception as e:
-        click.echo(f"{Fore.RED}Unexpected error during authentication: {str(e)}{Style.RESET_ALL}")
+        click.secho(f"Unexpected error during authentication: {str(e)}", fg="red")
 
     return False
 
@@ -623,7 +659,7 @@ def parse_jwt_token(token_string):
 
         # Decode base64
         decoded_bytes = base64.urlsafe_b64decode(payload)
-        payload_json = json.loads(decoded_bytes)
+        payload_json = _json_loads(decoded_bytes)
 
         # Extract user information
         user_info = {}
@@ -652,7 +688,7 @@ def parse_jwt_token(token_string):
         return user_info
 
     except Exception as e:
-        click.echo(f"{Fore.YELLOW}Warning: Could not parse token for user info: {e}{Style.RESET_ALL}")
+        click.secho(f"Warning: Could not parse token for user info: {e}", fg="yellow")
         return None
 
 
@@ -660,7 +696,35 @@ def parse_jwt_token(token_string):
 load_auth_state()
 
 
-@click.group(invoke_without_command=True)
+class LazyGroup(click.Group):
+    """Click group that imports the modules behind its lazy subcommands only when they are invoked."""
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name -> "module.attribute" of the click command object
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(super().list_commands(ctx) + [*self.lazy_subcommands])
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name):
+        module_name, attr_name = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+        cmd = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(cmd, click.Command):
+            raise ValueError(f"Lazy loading of {self.lazy_subcommands[cmd_name]} failed: not a click command")
+        return cmd
+
+
+@click.group(
+    cls=LazyGroup,
+    invoke_without_command=True,
+    lazy_subcommands={"config": "mycli_app.config.config", "resource": "mycli_app.resource.resource"},
+)
 @click.option("--version", "-v", is_flag=True, help="Show version information")
 @click.pass_context
 def cli(ctx, version):
@@ -674,110 +738,6 @@ def cli(ctx, version):
         click.echo("Use 'mycli --help' to see available commands.")
 
 
-@cli.group()
-def resource():
-    """Manage resources (dummy commands)."""
-    pass
-
-
-@resource.command()
-@click.option("--name", "-n", required=True, help="Name of the resource")
-@click.option("--location", "-l", default="eastus", help="Location for the resource")
-@click.option(
-    "--type",
-    "-t",
-    default="vm",
-    type=click.Choice(["vm", "storage", "database"], case_sensitive=False),
-    help="Type of resource to create",
-)
-def create(name, location, type):
-    """Create a new resource."""
-    click.echo(f"{Fore.GREEN}✓{Style.RESET_ALL} Creating {type} resource...")
-    click.echo(f"  Name: {Fore.CYAN}{name}{Style.RESET_ALL}")
-    click.echo(f"  Location: {Fore.CYAN}{location}{Style.RESET_ALL}")
-    click.echo(f"  Type: {Fore.CYAN}{type}{Style.RESET_ALL}")
-    click.echo(f"{Fore.GREEN}✓{Style.RESET_ALL} Resource '{name}' created successfully!")
-
-
-@resource.command()
-@click.option("--location", "-l", help="Filter by location")
-@click.option("--type", "-t", help="Filter by resource type")
-def list(location, type):
-    """List all resources."""
-    click.echo(f"{Fore.YELLOW}📋{Style.RESET_ALL} Listing resources...")
-
-    # Dummy data
-    resources = [
-        {"name": "myvm-001", "type": "vm", "location": "eastus", "status": "running"},
-        {"name": "mystorage-001", "type": "storage", "location": "westus", "status": "active"},
-        {"name": "mydb-001", "type": "database", "location": "eastus", "status": "running"},
-    ]
-
-    # Apply filters
-    filtered_resources = resources
-    if location:
-        filtered_resources = [r for r in filtered_resources if r["location"] == location]
-    if type:
-        filtered_resources = [r for r in filtered_resources if r["type"] == type]
-
-    if not filtered_resources:
-        click.echo(f"{Fore.YELLOW}No resources found matching the criteria.{Style.RESET_ALL}")
-        return
-
-    # Display table header
-    click.echo(f"\n{Fore.BLUE}{'Name':<15} {'Type':<10} {'Location':<10} {'Status':<10}{Style.RESET_ALL}")
-    click.echo("-" * 50)
-
-    # Display resources
-    for resource in filtered_resources:
-        status_color = Fore.GREEN if resource["status"] == "running" or resource["status"] == "active" else Fore.RED
-        click.echo(
-            f"{resource['name']:<15} {resource['type']:<10} {resource['location']:<10} {status_color}{resource['status']:<10}{Style.RESET_ALL}"
-        )
-
-
-@resource.command()
-@click.argument("name")
-@click.confirmation_option(prompt="Are you sure you want to delete this resource?")
-def delete(name):
-    """Delete a resource."""
-    click.echo(f"{Fore.RED}🗑️{Style.RESET_ALL}  Deleting resource '{name}'...")
-    click.echo(f"{Fore.GREEN}✓{Style.RESET_ALL} Resource '{name}' deleted successfully!")
-
-
-@cli.group()
-def config():
-    """Manage configuration settings."""
-    pass
-
-
-@config.command()
-@click.option("--key", "-k", required=True, help="Configuration key")
-@click.option("--value", "-v", required=True, help="Configuration value")
-def set(key, value):
-    """Set a configuration value."""
-    click.echo(f"{Fore.GREEN}✓{Style.RESET_ALL} Configuration set:")
-    click.echo(f"  {key} = {Fore.CYAN}{value}{Style.RESET_ALL}")
-
-
-@config.command()
-@click.option("--key", "-k", help="Specific configuration key to show")
-def show(key):
-    """Show configuration values."""
-    # Dummy configuration data
-    config_data = {"default_location": "eastus", "output_format": "table", "subscription": "my-subscription-123"}
-
-    if key:
-        if key in config_data:
-            click.echo(f"{key}: {Fore.CYAN}{config_data[key]}{Style.RESET_ALL}")
-        else:
-            click.echo(f"{Fore.RED}Configuration key '{key}' not found.{Style.RESET_ALL}")
-    else:
-        click.echo(f"{Fore.BLUE}Current configuration:{Style.RESET_ALL}")
-        for k, v in config_data.items():
-            click.echo(f"  {k}: {Fore.CYAN}{v}{Style.RESET_ALL}")
-
-
 @cli.command()
 @click.option("--tenant", "-t", help="Tenant ID to authenticate with")
 @click.option("--use-device-code", is_flag=True, help="Use device code flow instead of browser")
@@ -787,40 +747,40 @@ def show(key):
 def login(tenant, use_device_code, use_broker, force_broker, demo):
     """Authenticate with Azure."""
     if is_authenticated():
-        click.echo(f"{Fore.YELLOW}Already authenticated. Use 'logout' to sign out first.{Style.RESET_ALL}")
+        click.secho("Already authenticated. Use 'logout' to sign out first.", fg="yellow")
         return
 
-    click.echo(f"{Fore.BLUE}🔐 Starting Azure authentication...{Style.RESET_ALL}")
+    click.secho("🔐 Starting Azure authentication...", fg="blue")
 
     if tenant:
-        click.echo(f"  Tenant: {Fore.CYAN}{tenant}{Style.RESET_ALL}")
+        click.echo("  Tenant: " + click.style(tenant, fg="cyan"))
 
     if use_broker or force_broker:
-        click.echo(f"{Fore.BLUE}  Method: {Fore.CYAN}Broker-based authentication{Style.RESET_ALL}")
+        click.echo(click.style("  Method: ", fg="blue") + click.style("Broker-based authentication", fg="cyan"))
         broker_info = get_broker_info()
         if broker_info["platform_support"]:
-            click.echo(f"  Available: {Fore.GREEN}{', '.join(broker_info['recommendations'])}{Style.RESET_ALL}")
+            click.echo("  Available: " + click.style(", ".join(broker_info["recommendations"]), fg="green"))
         else:
-            click.echo(f"{Fore.YELLOW}  Warning: Limited broker support on this platform{Style.RESET_ALL}")
+            click.secho("  Warning: Limited broker support on this platform", fg="yellow")
             if force_broker:
-                click.echo(
-                    f"{Fore.RED}❌ Force broker specified but platform doesn't support native broker authentication{Style.RESET_ALL}"
+                click.secho(
+                    "❌ Force broker specified but platform doesn't support native broker authentication", fg="red"
                 )
                 sys.exit(1)
 
     if use_device_code:
-        click.echo(f"{Fore.BLUE}  Method: {Fore.CYAN}Device Code Flow{Style.RESET_ALL}")
+        click.echo(click.style("  Method: ", fg="blue") + click.style("Device Code Flow", fg="cyan"))
 
     # Demo mode for testing without actual Azure login
     if demo:
-        click.echo(f"{Fore.YELLOW}[DEMO MODE] Simulating Azure authentication...{Style.RESET_ALL}")
+        click.secho("[DEMO MODE] Simulating Azure authentication...", fg="yellow")
         _auth_state["is_authenticated"] = True
         _auth_state["user_info"] = {"user_id": "demo.user@contoso.com", "display_name": "Demo User"}
         _auth_state["tenant_id"] = tenant or "demo-tenant-id"
         _auth_state["auth_method"] = "demo"
         save_auth_state()
-        click.echo(f"{Fore.GREEN}✓ Successfully authenticated! (Demo Mode){Style.RESET_ALL}")
-        click.echo(f"  User: {Fore.CYAN}demo.user@contoso.com{Style.RESET_ALL}")
+        click.secho("✓ Successfully authenticated! (Demo Mode)", fg="green")
+        click.echo("  User: " + click.style("demo.user@contoso.com", fg="cyan"))
         return
 
     # Determine actual authentication method to use
@@ -829,18 +789,18 @@ def login(tenant, use_device_code, use_broker, force_broker, demo):
     if authenticate_user(tenant, final_use_broker, use_device_code, force_broker):
         user_info = _auth_state.get("user_info", {})
         auth_method = _auth_state.get("auth_method", "unknown")
-        click.echo(f"{Fore.GREEN}✓ Successfully authenticated!{Style.RESET_ALL}")
-        click.echo(f"  User: {Fore.CYAN}{user_info.get('user_id', 'unknown')}{Style.RESET_ALL}")
-        click.echo(f"  Method: {Fore.CYAN}{auth_method}{Style.RESET_ALL}")
+        click.secho("✓ Successfully authenticated!", fg="green")
+        click.echo("  User: " + click.style(user_info.get("user_id", "unknown"), fg="cyan"))
+        click.echo("  Method: " + click.style(auth_method, fg="cyan"))
         if tenant:
-            click.echo(f"  Tenant: {Fore.CYAN}{tenant}{Style.RESET_ALL}")
+            click.echo("  Tenant: " + click.style(tenant, fg="cyan"))
     else:
-        click.echo(f"{Fore.RED}❌ Authentication failed{Style.RESET_ALL}")
-        if not AZURE_AVAILABLE:
-            click.echo(f"{Fore.YELLOW}💡 Tip: Install Azure packages with:{Style.RESET_ALL}")
+        click.secho("❌ Authentication failed", fg="red")
+        if not azure_available():
+            click.secho("💡 Tip: Install Azure packages with:", fg="yellow")
             click.echo("    pip install azure-identity azure-mgmt-core azure-core msal")
         elif use_broker or force_broker:
-            click.echo(f"{Fore.YELLOW}💡 Broker authentication tips:{Style.RESET_ALL}")
+            click.secho("💡 Broker authentication tips:", fg="yellow")
             if os.name == "nt":  # Windows
                 click.echo("    - Ensure Windows Hello is set up")
                 click.echo("    - Ensure Microsoft Authenticator is installed and configured")
@@ -862,20 +822,20 @@ def login(tenant, use_device_code, use_broker, force_broker, demo):
 def logout():
     """Logout from Azure authentication."""
     if not is_authenticated():
-        click.echo(f"{Fore.YELLOW}Not currently authenticated.{Style.RESET_ALL}")
+        click.secho("Not currently authenticated.", fg="yellow")
         return
 
-    click.echo(f"{Fore.YELLOW}👋 Logging out...{Style.RESET_ALL}")
+    click.secho("👋 Logging out...", fg="yellow")
     clear_auth_state()
-    click.echo(f"{Fore.GREEN}✓ Successfully logged out!{Style.RESET_ALL}")
-    click.echo(f"{Fore.BLUE}💡 Note: You may need to clear your browser cache for complete logout.{Style.RESET_ALL}")
+    click.secho("✓ Successfully logged out!", fg="green")
+    click.secho("💡 Note: You may need to clear your browser cache for complete logout.", fg="blue")
 
 
 @cli.command()
 def whoami():
     """Show current authenticated user information."""
     if not is_authenticated():
-        click.echo(f"{Fore.RED}Not authenticated. Use 'mycli login' to sign in.{Style.RESET_ALL}")
+        click.secho("Not authenticated. Use 'mycli login' to sign in.", fg="red")
         return
 
     user_info = _auth_state.get("user_info", {})
@@ -883,73 +843,80 @@ def whoami():
     auth_method = _auth_state.get("auth_method", "unknown")
     broker_info = _auth_state.get("broker_info")
 
-    click.echo(f"{Fore.BLUE}Current Authentication:{Style.RESET_ALL}")
-    click.echo(f"  User: {Fore.CYAN}{user_info.get('user_id', 'unknown')}{Style.RESET_ALL}")
-    click.echo(f"  Display Name: {Fore.CYAN}{user_info.get('display_name', 'unknown')}{Style.RESET_ALL}")
-    click.echo(f"  Tenant: {Fore.CYAN}{tenant_id or 'common'}{Style.RESET_ALL}")
+    lines = []
+    lines.append(click.style("Current Authentication:", fg="blue"))
+    lines.append("  User: " + click.style(user_info.get("user_id", "unknown"), fg="cyan"))
+    lines.append("  Display Name: " + click.style(user_info.get("display_name", "unknown"), fg="cyan"))
+    lines.append("  Tenant: " + click.style(tenant_id or "common", fg="cyan"))
 
-    click.echo(f"  Auth Method: {Fore.CYAN}{auth_method}{Style.RESET_ALL}")
-    click.echo(f"  Status: {Fore.GREEN}Authenticated{Style.RESET_ALL}")
+    lines.append("  Auth Method: " + click.style(auth_method, fg="cyan"))
+    lines.append("  Status: " + click.style("Authenticated", fg="green"))
 
     if broker_info and auth_method == "broker":
-        click.echo(f"\n{Fore.BLUE}Broker Information:{Style.RESET_ALL}")
-        click.echo(
-            f"  Platform Support: {Fore.GREEN if broker_info.get('platform_support') else Fore.RED}{'Yes' if broker_info.get('platform_support') else 'No'}{Style.RESET_ALL}"
+        lines.append("")
+        lines.append(click.style("Broker Information:", fg="blue"))
+        supported = broker_info.get("platform_support")
+        lines.append(
+            "  Platform Support: " + click.style("Yes" if supported else "No", fg="green" if supported else "red")
         )
         if broker_info.get("recommendations"):
-            click.echo(f"  Available Methods: {Fore.CYAN}{', '.join(broker_info['recommendations'])}{Style.RESET_ALL}")
+            lines.append("  Available Methods: " + click.style(", ".join(broker_info["recommendations"]), fg="cyan"))
 
-    click.echo(
-        f"\n{Fore.BLUE}Azure SDK: {Fore.GREEN if AZURE_AVAILABLE else Fore.RED}{'Available' if AZURE_AVAILABLE else 'Not Available'}{Style.RESET_ALL}"
+    lines.append("")
+    lines.append(
+        click.style("Azure SDK: ", fg="blue")
+        + click.style("Available" if azure_available() else "Not Available", fg="green" if azure_available() else "red")
     )
+    _emit(lines)
 
 
 @cli.command()
 def broker():
     """Show broker authentication capabilities and information."""
-    click.echo(f"{Fore.BLUE}🔐 Broker Authentication Information:{Style.RESET_ALL}")
+    click.secho("🔐 Broker Authentication Information:", fg="blue")
 
     broker_info = get_broker_info()
 
     # Platform support
-    click.echo(f"\n{Fore.BLUE}Platform Support:{Style.RESET_ALL}")
-    click.echo(f"  Operating System: {Fore.CYAN}{os.name}{Style.RESET_ALL}")
-    platform_color = Fore.GREEN if broker_info["platform_support"] else Fore.RED
+    click.secho("\nPlatform Support:", fg="blue")
+    click.echo("  Operating System: " + click.style(os.name, fg="cyan"))
+    platform_color = "green" if broker_info["platform_support"] else "red"
     click.echo(
-        f"  Broker Support: {platform_color}{'Available' if broker_info['platform_support'] else 'Limited'}{Style.RESET_ALL}"
+        "  Broker Support: "
+        + click.style("Available" if broker_info["platform_support"] else "Limited", fg=platform_color)
     )
 
     # Available methods
     if broker_info.get("recommendations"):
-        click.echo(f"\n{Fore.BLUE}Available Authentication Methods:{Style.RESET_ALL}")
+        click.secho("\nAvailable Authentication Methods:", fg="blue")
         for method in broker_info["recommendations"]:
-            click.echo(f"  • {Fore.GREEN}{method}{Style.RESET_ALL}")
+            click.echo("  • " + click.style(method, fg="green"))
 
     # Windows Hello status
     if broker_info.get("windows_hello_available"):
-        click.echo(f"\n{Fore.BLUE}Windows Hello:{Style.RESET_ALL}")
-        click.echo(f"  Status: {Fore.GREEN}Available{Style.RESET_ALL}")
+        click.secho("\nWindows Hello:", fg="blue")
+        click.echo("  Status: " + click.style("Available", fg="green"))
         click.echo("  Benefits: Biometric authentication, PIN-based auth")
 
     # macOS Keychain and Touch ID status
     if broker_info.get("keychain_available"):
-        click.echo(f"\n{Fore.BLUE}macOS Keychain:{Style.RESET_ALL}")
-        click.echo(f"  Status: {Fore.GREEN}Available{Style.RESET_ALL}")
+        click.secho("\nmacOS Keychain:", fg="blue")
+        click.echo("  Status: " + click.style("Available", fg="green"))
         click.echo("  Benefits: Secure credential storage, seamless authentication")
 
     if broker_info.get("touch_id_available"):
-        click.echo(f"\n{Fore.BLUE}Touch ID / Face ID:{Style.RESET_ALL}")
-        click.echo(f"  Status: {Fore.GREEN}Available{Style.RESET_ALL}")
+        click.secho("\nTouch ID / Face ID:", fg="blue")
+        click.echo("  Status: " + click.style("Available", fg="green"))
         click.echo("  Benefits: Biometric authentication, secure hardware-backed keys")
 
     # Microsoft Authenticator status
     if broker_info.get("authenticator_app_available"):
-        click.echo(f"\n{Fore.BLUE}Microsoft Authenticator:{Style.RESET_ALL}")
-        click.echo(f"  Status: {Fore.GREEN}Supported{Style.RESET_ALL}")
+        click.secho("\nMicrosoft Authenticator:", fg="blue")
+        click.echo("  Status: " + click.style("Supported", fg="green"))
         click.echo("  Benefits: Push notifications, time-based codes")
 
     # Usage instructions
-    click.echo(f"\n{Fore.BLUE}Usage:{Style.RESET_ALL}")
+    click.secho("\nUsage:", fg="blue")
     click.echo("  • Use 'mycli login --use-broker' for broker authentication")
     click.echo("  • Use 'mycli login --force-broker' for native broker only (no fallback)")
     click.echo("  • Use 'mycli login --use-device-code' for device code flow")
@@ -957,80 +924,86 @@ def broker():
 
     # Platform-specific setup instructions
     if platform.system() == "Darwin":  # macOS
-        click.echo(f"\n{Fore.BLUE}macOS Setup:{Style.RESET_ALL}")
+        click.secho("\nmacOS Setup:", fg="blue")
         click.echo("  • Install Microsoft Company Portal from the App Store for enhanced broker features")
         click.echo("  • Ensure Touch ID is enabled in System Preferences > Touch ID & Password")
         click.echo("  • Configure Microsoft Authenticator app if using multi-factor authentication")
 
     # Dependency information
-    click.echo(f"\n{Fore.BLUE}Dependencies:{Style.RESET_ALL}")
+    click.secho("\nDependencies:", fg="blue")
     if platform.system() == "Darwin":  # macOS
         click.echo(
-            f'  For native broker support on macOS: {Fore.CYAN}pip install "msal[broker]>=1.20,<2"{Style.RESET_ALL}'
+            "  For native broker support on macOS: " + click.style('pip install "msal[broker]>=1.20,<2"', fg="cyan")
         )
         click.echo("  Recommended: Microsoft Company Portal (App Store)")
     else:
-        click.echo(f'  For native broker support: {Fore.CYAN}pip install "msal[broker]>=1.20,<2"{Style.RESET_ALL}')
+        click.echo("  For native broker support: " + click.style('pip install "msal[broker]>=1.20,<2"', fg="cyan"))
     click.echo("  Without this, broker authentication falls back to browser")
 
     if not broker_info["platform_support"]:
-        click.echo(
-            f"\n{Fore.YELLOW}Note: Broker authentication is optimized for Windows and macOS platforms.{Style.RESET_ALL}"
-        )
-        click.echo(f"{Fore.YELLOW}Consider using device code flow on other platforms.{Style.RESET_ALL}")
+        click.secho("\nNote: Broker authentication is optimized for Windows and macOS platforms.", fg="yellow")
+        click.secho("Consider using device code flow on other platforms.", fg="yellow")
 
     # Current authentication status
     if is_authenticated():
         auth_method = _auth_state.get("auth_method", "unknown")
-        click.echo(f"\n{Fore.BLUE}Current Session:{Style.RESET_ALL}")
-        click.echo(f"  Authentication Method: {Fore.CYAN}{auth_method}{Style.RESET_ALL}")
+        click.secho("\nCurrent Session:", fg="blue")
+        click.echo("  Authentication Method: " + click.style(auth_method, fg="cyan"))
         if auth_method in ["broker_cached", "broker_interactive"]:
-            click.echo(f"  Status: {Fore.GREEN}Using native broker authentication{Style.RESET_ALL}")
+            click.echo("  Status: " + click.style("Using native broker authentication", fg="green"))
         elif auth_method in ["broker_cache", "browser_with_broker"]:
-            click.echo(f"  Status: {Fore.YELLOW}Using broker-enabled authentication{Style.RESET_ALL}")
+            click.echo("  Status: " + click.style("Using broker-enabled authentication", fg="yellow"))
 
 
 @cli.command()
 def account():
     """Manage account and authentication settings."""
     if not is_authenticated():
-        click.echo(f"{Fore.YELLOW}Account Information:{Style.RESET_ALL}")
-        click.echo(f"  Status: {Fore.RED}Not Authenticated{Style.RESET_ALL}")
-        click.echo("  Use 'mycli login' to sign in")
+        _emit(
+            [
+                click.style("Account Information:", fg="yellow"),
+                "  Status: " + click.style("Not Authenticated", fg="red"),
+                "  Use 'mycli login' to sign in",
+            ]
+        )
         return
 
     user_info = _auth_state.get("user_info", {})
     tenant_id = _auth_state.get("tenant_id")
     auth_method = _auth_state.get("auth_method", "unknown")
 
-    click.echo(f"{Fore.BLUE}Account Information:{Style.RESET_ALL}")
-    click.echo(f"  Status: {Fore.GREEN}Authenticated{Style.RESET_ALL}")
-    click.echo(f"  User: {Fore.CYAN}{user_info.get('user_id', 'unknown')}{Style.RESET_ALL}")
-    click.echo(f"  Display Name: {Fore.CYAN}{user_info.get('display_name', 'unknown')}{Style.RESET_ALL}")
-    click.echo(f"  Tenant: {Fore.CYAN}{tenant_id or 'common'}{Style.RESET_ALL}")
-    click.echo(f"  Auth Method: {Fore.CYAN}{auth_method}{Style.RESET_ALL}")
+    lines = []
+    lines.append(click.style("Account Information:", fg="blue"))
+    lines.append("  Status: " + click.style("Authenticated", fg="green"))
+    lines.append("  User: " + click.style(user_info.get("user_id", "unknown"), fg="cyan"))
+    lines.append("  Display Name: " + click.style(user_info.get("display_name", "unknown"), fg="cyan"))
+    lines.append("  Tenant: " + click.style(tenant_id or "common", fg="cyan"))
+    lines.append("  Auth Method: " + click.style(auth_method, fg="cyan"))
 
-    if CONFIG_FILE.exists():
-        click.echo(f"  Config File: {Fore.CYAN}{CONFIG_FILE}{Style.RESET_ALL}")
+    if os.path.exists(_CONFIG_PATH):
+        lines.append("  Config File: " + click.style(str(CONFIG_FILE), fg="cyan"))
+    _emit(lines)
 
 
 @cli.command()
 @click.option("--all", is_flag=True, help="Clear all cache including MSAL broker cache")
 def clear_cache(all):
     """Clear authentication cache and credentials."""
+    global _config_dir_ready
     import shutil
     from pathlib import Path
 
     cleared_count = 0
 
     # Clear mycli config and cache
-    if CONFIG_DIR.exists():
+    if os.path.exists(_CONFIG_DIR_PATH):
         try:
-            shutil.rmtree(str(CONFIG_DIR))
-            click.echo(f"{Fore.GREEN}✓ Cleared MyCliApp config directory{Style.RESET_ALL}")
+            shutil.rmtree(_CONFIG_DIR_PATH)
+            _config_dir_ready = False
+            click.secho("✓ Cleared MyCliApp config directory", fg="green")
             cleared_count += 1
         except Exception as e:
-            click.echo(f"{Fore.RED}Failed to remove config directory: {e}{Style.RESET_ALL}")
+            click.secho(f"Failed to remove config directory: {e}", fg="red")
 
     if all:
         # Clear MSAL cache (Windows)
@@ -1045,10 +1018,10 @@ def clear_cache(all):
                 if cache_path.exists():
                     try:
                         shutil.rmtree(str(cache_path))
-                        click.echo(f"{Fore.GREEN}✓ Cleared MSAL cache{Style.RESET_ALL}")
+                        click.secho("✓ Cleared MSAL cache", fg="green")
                         cleared_count += 1
                     except Exception as e:
-                        click.echo(f"{Fore.YELLOW}Could not clear MSAL cache: {e}{Style.RESET_ALL}")
+                        click.secho(f"Could not clear MSAL cache: {e}", fg="yellow")
 
         # Clear MSAL cache (macOS)
         elif platform.system() == "Darwin":
@@ -1066,17 +1039,18 @@ def clear_cache(all):
                             cache_path.unlink()
                         else:
                             shutil.rmtree(str(cache_path))
-                        click.echo(f"{Fore.GREEN}✓ Cleared MSAL cache (macOS){Style.RESET_ALL}")
+                        click.secho("✓ Cleared MSAL cache (macOS)", fg="green")
                         cleared_count += 1
                     except Exception as e:
-                        click.echo(f"{Fore.YELLOW}Could not clear MSAL cache: {e}{Style.RESET_ALL}")
+                        click.secho(f"Could not clear MSAL cache: {e}", fg="yellow")
 
             # Clear macOS Keychain MSAL entries (if accessible)
             try:
                 # Note: This is a placeholder - actual keychain clearing would require
                 # more specific implementation or user interaction
-                click.echo(
-                    f"{Fore.BLUE}💡 Tip: To clear keychain entries, run: security delete-generic-password -s 'Microsoft MSAL'{Style.RESET_ALL}"
+                click.secho(
+                    "💡 Tip: To clear keychain entries, run: security delete-generic-password -s 'Microsoft MSAL'",
+                    fg="blue",
                 )
             except Exception:
                 pass
@@ -1091,21 +1065,21 @@ def clear_cache(all):
                             item.unlink()
                         elif item.is_dir():
                             shutil.rmtree(str(item))
-                        click.echo(f"{Fore.GREEN}✓ Cleared Azure CLI cache item{Style.RESET_ALL}")
+                        click.secho("✓ Cleared Azure CLI cache item", fg="green")
                         cleared_count += 1
                     except Exception as e:
-                        click.echo(f"{Fore.YELLOW}Could not clear Azure item: {e}{Style.RESET_ALL}")
+                        click.secho(f"Could not clear Azure item: {e}", fg="yellow")
 
     # Clear in-memory auth state
     clear_auth_state()
 
     if cleared_count == 0:
-        click.echo(f"{Fore.YELLOW}No cache files found to clear{Style.RESET_ALL}")
+        click.secho("No cache files found to clear", fg="yellow")
     else:
-        click.echo(f"{Fore.GREEN}✓ Successfully cleared {cleared_count} cache location(s){Style.RESET_ALL}")
+        click.secho(f"✓ Successfully cleared {cleared_count} cache location(s)", fg="green")
 
     if all:
-        click.echo(f"\n{Fore.BLUE}💡 Additional cleanup recommendations:{Style.RESET_ALL}")
+        click.secho("\n💡 Additional cleanup recommendations:", fg="blue")
         click.echo("  • Clear browser cache for login.microsoftonline.com")
 
         if os.name == "nt":  # Windows
@@ -1122,37 +1096,44 @@ def clear_cache(all):
 def status():
     """Show current status and health."""
     auth_status = "Active" if is_authenticated() else "Not Authenticated"
-    auth_color = Fore.GREEN if is_authenticated() else Fore.RED
+    auth_color = "green" if is_authenticated() else "red"
 
     user_info = _auth_state.get("user_info", {}) if is_authenticated() else {}
     user_display = user_info.get("user_id", "None") if is_authenticated() else "None"
     auth_method = _auth_state.get("auth_method", "None") if is_authenticated() else "None"
 
-    click.echo(f"{Fore.BLUE}📊 System Status:{Style.RESET_ALL}")
-    click.echo(f"  Service: {Fore.GREEN}Online{Style.RESET_ALL}")
-    click.echo(f"  Authentication: {auth_color}{auth_status} ({user_display}){Style.RESET_ALL}")
+    lines = []
+    lines.append(click.style("📊 System Status:", fg="blue"))
+    lines.append("  Service: " + click.style("Online", fg="green"))
+    lines.append("  Authentication: " + click.style(f"{auth_status} ({user_display})", fg=auth_color))
     if is_authenticated():
-        click.echo(f"  Auth Method: {Fore.CYAN}{auth_method}{Style.RESET_ALL}")
+        lines.append("  Auth Method: " + click.style(auth_method, fg="cyan"))
 
     # Broker support information
     broker_info = get_broker_info()
-    broker_color = Fore.GREEN if broker_info["platform_support"] else Fore.YELLOW
+    broker_color = "green" if broker_info["platform_support"] else "yellow"
     broker_status = "Available" if broker_info["platform_support"] else "Limited"
-    click.echo(f"  Broker Support: {broker_color}{broker_status}{Style.RESET_ALL}")
+    lines.append("  Broker Support: " + click.style(broker_status, fg=broker_color))
 
-    click.echo(
-        f"  Azure SDK: {Fore.GREEN if AZURE_AVAILABLE else Fore.RED}{'Available' if AZURE_AVAILABLE else 'Not Available'}{Style.RESET_ALL}"
+    lines.append(
+        "  Azure SDK: "
+        + click.style("Available" if azure_available() else "Not Available", fg="green" if azure_available() else "red")
     )
-    click.echo(f"  Version: {Fore.CYAN}{__version__}{Style.RESET_ALL}")
+    lines.append("  Version: " + click.style(__version__, fg="cyan"))
 
-    if not AZURE_AVAILABLE:
-        click.echo(f"\n{Fore.YELLOW}💡 Install Azure packages for full functionality:{Style.RESET_ALL}")
-        click.echo("    pip install azure-identity azure-mgmt-core azure-core msal")
+    if not azure_available():
+        lines.append("")
+        lines.append(click.style("💡 Install Azure packages for full functionality:", fg="yellow"))
+        lines.append("    pip install azure-identity azure-mgmt-core azure-core msal")
 
     if not broker_info["platform_support"]:
-        click.echo(
-            f"\n{Fore.YELLOW}💡 For enhanced security, use broker authentication on Windows or macOS platforms{Style.RESET_ALL}"
+        lines.append("")
+        lines.append(
+            click.style(
+                "💡 For enhanced security, use broker authentication on Windows or macOS platforms", fg="yellow"
+            )
         )
+    _emit(lines)
 
 
 def main():
@@ -1160,10 +1141,10 @@ def main():
     try:
         cli()
     except KeyboardInterrupt:
-        click.echo(f"\n{Fore.YELLOW}Operation cancelled.{Style.RESET_ALL}")
+        click.secho("\nOperation cancelled.", fg="yellow")
         sys.exit(1)
     except Exception as e:
-        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        click.secho(f"Error: {e}", fg="red")
         sys.exit(1)
 
 
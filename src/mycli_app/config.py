@@ -0,0 +1,43 @@
+"""
+Dummy configuration commands, loaded on demand by the top-level CLI group.
+"""
+
+import click
+
+from ._output import _OK
+
+
+@click.group()
+def config():
+    """Manage configuration settings."""
+    pass
+
+
+@config.command()
+@click.option("--key", "-k", required=True, help="Configuration key")
+@click.option("--value", "-v", required=True, help="Configuration value")
+def set(key, value):
+    """Set a configuration value."""
+    click.echo(f"{_OK} Configuration set:")
+    click.echo(f"  {key} = " + click.style(value, fg="cyan"))
+
+
+# Dummy configuration data, pre-rendered once for the full and single-key views of `config show`
+_CONFIG_DATA = {"default_location": "eastus", "output_format": "table", "subscription": "my-subscription-123"}
+_CONFIG_SINGLE = {k: f"{k}: " + click.style(v, fg="cyan") for k, v in _CONFIG_DATA.items()}
+_CONFIG_FULL = "\n".join(
+    [click.style("Current configuration:", fg="blue")] + [f"  {_CONFIG_SINGLE[k]}" for k in _CONFIG_DATA]
+)
+
+
+@config.command()
+@click.option("--key", "-k", help="Specific configuration key to show")
+def show(key):
+    """Show configuration values."""
+    if key:
+        if key in _CONFIG_SINGLE:
+            click.echo(_CONFIG_SINGLE[key])
+        else:
+            click.secho(f"Configuration key '{key}' not found.", fg="red")
+    else:
+        click.echo(_CONFIG_FULL)
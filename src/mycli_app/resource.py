@@ -0,0 +1,81 @@
+"""
+Dummy resource management commands, loaded on demand by the top-level CLI group.
+"""
+
+import collections
+
+import click
+
+from ._output import _LIST, _OK, _TRASH, _emit
+
+
+@click.group()
+def resource():
+    """Manage resources (dummy commands)."""
+    pass
+
+
+@resource.command()
+@click.option("--name", "-n", required=True, help="Name of the resource")
+@click.option("--location", "-l", default="eastus", help="Location for the resource")
+@click.option(
+    "--type",
+    "-t",
+    default="vm",
+    type=click.Choice(["vm", "storage", "database"], case_sensitive=False),
+    help="Type of resource to create",
+)
+def create(name, location, type):
+    """Create a new resource."""
+    click.echo(f"{_OK} Creating {type} resource...")
+    click.echo("  Name: " + click.style(name, fg="cyan"))
+    click.echo("  Location: " + click.style(location, fg="cyan"))
+    click.echo("  Type: " + click.style(type, fg="cyan"))
+    click.echo(f"{_OK} Resource '{name}' created successfully!")
+
+
+# Healthy statuses render green; anything else falls back to red
+_STATUS_COLOR = collections.defaultdict(lambda: "red", running="green", active="green")
+
+
+@resource.command()
+@click.option("--location", "-l", help="Filter by location")
+@click.option("--type", "-t", help="Filter by resource type")
+def list(location, type):
+    """List all resources."""
+    banner = f"{_LIST} Listing resources..."
+
+    # Dummy data
+    resources = [
+        {"name": "myvm-001", "type": "vm", "location": "eastus", "status": "running"},
+        {"name": "mystorage-001", "type": "storage", "location": "westus", "status": "active"},
+        {"name": "mydb-001", "type": "database", "location": "eastus", "status": "running"},
+    ]
+
+    # Apply both filters in a single pass
+    loc, typ = location, type
+    filtered_resources = [r for r in resources if (not loc or r["location"] == loc) and (not typ or r["type"] == typ)]
+
+    if not filtered_resources:
+        click.echo(banner)
+        click.secho("No resources found matching the criteria.", fg="yellow")
+        return
+
+    # Display the banner, table header and resources in one write
+    header = click.style(f"{'Name':<15} {'Type':<10} {'Location':<10} {'Status':<10}", fg="blue")
+    lines = [banner, "", header, "-" * 50]
+    lines += [
+        f"{r['name']:<15} {r['type']:<10} {r['location']:<10} "
+        + click.style(f"{r['status']:<10}", fg=_STATUS_COLOR[r["status"]])
+        for r in filtered_resources
+    ]
+    _emit(lines)
+
+
+@resource.command()
+@click.argument("name")
+@click.confirmation_option(prompt="Are you sure you want to delete this resource?")
+def delete(name):
+    """Delete a resource."""
+    click.echo(f"{_TRASH}  Deleting resource '{name}'...")
+    click.echo(f"{_OK} Resource '{name}' deleted successfully!")